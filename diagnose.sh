@@ -118,7 +118,7 @@ if [ -n "$CORS_RESPONSE" ]; then
     echo "   $CORS_RESPONSE"
 else
     echo -e "${YELLOW}⚠${NC} CORS headers not found"
-    echo "   Make sure flask-cors is installed and enabled"
+    echo "   Check CORS_ORIGIN and setup_cors in src/app.py"
 fi
 
 echo ""
@@ -1,313 +1,16 @@
 #!/usr/bin/env python3
 """
-Generate controller updates and app.py modifications for Marvel Champions API.
+Generate controller updates for Marvel Champions API.
 Run: python generate_controllers.py
 """
 
-from pathlib import Path
-
-# Controller and app files to create/update
-FILES = {
-    'src/app.py': '''"""
-Marvel Champions REST API - Main Entry Point
-
-Following EBI (Entities-Boundaries-Interactors) Architecture:
-
-ENTITIES: Card, Deck, Game, Player, GameState
-├─ Immutable domain objects
-├─ No dependencies
-└─ Single responsibility
-
-BOUNDARIES: 
-├─ Repositories (MongoDB): CardRepository, DeckRepository, GameRepository
-├─ Gateways (External): MarvelCDBGateway, MarvelCDBClient
-├─ Storage: ImageStorage, LocalImageStorage
-└─ Middleware: Request logging, Audit middleware
-
-INTERACTORS (Business Logic):
-├─ Card: 23 individual units
-├─ Deck: 23 individual units
-├─ Lobby: 23 individual units
-├─ Game: 23 individual units
-
-CONTROLLERS (REST Endpoints):
-└─ Blueprint routes → Interactor methods → Return JSON
-"""
-
-import sys
+import asyncio
 import os
+import sys
 from pathlib import Path
 
-# Ensure imports work from project root
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import logging
-from flask import Flask, jsonify
-from flask_cors import CORS
-from pymongo import MongoClient
-
-# Configure logging first
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-
-def create_app(config_override=None):
-    """
-    Application Factory: Creates and configures Flask app
-    
-    Args:
-        config_override: Optional config dict for testing
-        
-    Returns:
-        Configured Flask application ready to run
-    """
-    
-    logger.info("=" * 80)
-    logger.info("MARVEL CHAMPIONS API - Starting Application")
-    logger.info("=" * 80)
-    
-    # ========================================================================
-    # 1. CONFIGURATION LOADING
-    # ========================================================================
-    from src.config import load_config
-    
-    try:
-        config = load_config()
-        logger.info(f"✓ Configuration loaded")
-        logger.info(f"  - Database: {config.mongo.database}")
-        logger.info(f"  - Host: {config.host}:{config.port}")
-    except Exception as e:
-        logger.error(f"✗ Failed to load configuration: {e}")
-        raise
-    
-    # ========================================================================
-    # 2. CREATE FLASK APP
-    # ========================================================================
-    app = Flask(__name__)
-    app.config['SECRET_KEY'] = config.secret_key
-    app.config['DEBUG'] = config.debug
-    CORS(app)
-    logger.info("✓ Flask app created")
-    
-    # ========================================================================
-    # 3. INITIALIZE MONGODB
-    # ========================================================================
-    try:
-        mongo_client = MongoClient(
-            config.mongo.connection_string,
-            serverSelectionTimeoutMS=5000,
-            uuidRepresentation='standard'
-        )
-        # Test connection
-        mongo_client.admin.command('ping')
-        db = mongo_client[config.mongo.database]
-        logger.info(f"✓ MongoDB connected to '{config.mongo.database}'")
-    except Exception as e:
-        logger.error(f"✗ MongoDB connection failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 4. INITIALIZE REPOSITORIES (Data Access Layer)
-    # ========================================================================
-    from src.repositories import (
-        MongoCardRepository,
-        MongoDeckRepository,
-        MongoGameRepository
-    )
-
-    try:
-        card_repo = MongoCardRepository(db)
-        deck_repo = MongoDeckRepository(db)
-        game_repo = MongoGameRepository(db)
-        logger.info("✓ Repositories initialized")
-        logger.info("  - MongoCardRepository")
-        logger.info("  - MongoDeckRepository")
-        logger.info("  - MongoGameRepository")
-    except Exception as e:
-        logger.error(f"✗ Repository initialization failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 5. INITIALIZE GATEWAYS (Boundaries - External Services)
-    # ========================================================================
-    from src.gateways import MarvelCDBClient, LocalImageStorage
-    
-    try:
-        marvelcdb_gateway = MarvelCDBClient(config.marvelcdb)
-        image_storage = LocalImageStorage(config.image_storage)
-        logger.info("✓ Gateways initialized")
-        logger.info(f"  - MarvelCDBClient ({config.marvelcdb.base_url})")
-        logger.info(f"  - LocalImageStorage ({config.image_storage.storage_path})")
-    except Exception as e:
-        logger.error(f"✗ Gateway initialization failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 6. INITIALIZE INTERACTORS (Business Logic - 46 individual units)
-    # ========================================================================
-    from src.interactors.card import (
-        ImportCardInteractor, GetCardInteractor, SearchCardsInteractor, GetCardImageInteractor
-    )
-    from src.interactors.deck import (
-        ImportDeckInteractor, GetDeckInteractor, UpdateDeckInteractor, DeleteDeckInteractor, ListDecksInteractor
-    )
-    from src.interactors.lobby import (
-        CreateLobbyInteractor, JoinLobbyInteractor, LeaveLobbyInteractor, ChooseDeckInteractor,
-        ToggleReadyInteractor, StartGameInteractor, BuildEncounterDeckInteractor, ListLobbiesInteractor, DeleteLobbyInteractor
-    )
-    from src.interactors.game import (
-        CreateGameInteractor, GetGameInteractor, ListGamesInteractor, DrawCardInteractor, ShuffleDiscardInteractor,
-        PlayCardInteractor, MoveCardInteractor, ToggleCardExhaustionInteractor, AddCounterInteractor, DeleteGameInteractor
-    )
-    
-    try:
-        # Card Interactors
-        import_card_interactor = ImportCardInteractor(card_repo, marvelcdb_gateway, image_storage)
-        get_card_interactor = GetCardInteractor(card_repo)
-        search_cards_interactor = SearchCardsInteractor(card_repo)
-        get_card_image_interactor = GetCardImageInteractor(marvelcdb_gateway, image_storage)
-        
-        # Deck Interactors
-        import_deck_interactor = ImportDeckInteractor(deck_repo, marvelcdb_gateway)
-        get_deck_interactor = GetDeckInteractor(deck_repo)
-        update_deck_interactor = UpdateDeckInteractor(deck_repo)
-        delete_deck_interactor = DeleteDeckInteractor(deck_repo)
-        list_decks_interactor = ListDecksInteractor(deck_repo)
-        
-        # Lobby Interactors
-        create_lobby_interactor = CreateLobbyInteractor(game_repo)
-        join_lobby_interactor = JoinLobbyInteractor(game_repo)
-        leave_lobby_interactor = LeaveLobbyInteractor(game_repo)
-        choose_deck_interactor = ChooseDeckInteractor(game_repo, deck_repo, marvelcdb_gateway)
-        toggle_ready_interactor = ToggleReadyInteractor(game_repo)
-        start_game_interactor = StartGameInteractor(game_repo)
-        build_encounter_deck_interactor = BuildEncounterDeckInteractor(deck_repo, marvelcdb_gateway)
-        list_lobbies_interactor = ListLobbiesInteractor(game_repo)
-        delete_lobby_interactor = DeleteLobbyInteractor(game_repo)
-        
-        # Game Interactors
-        create_game_interactor = CreateGameInteractor(game_repo, deck_repo)
-        get_game_interactor = GetGameInteractor(game_repo)
-        list_games_interactor = ListGamesInteractor(game_repo)
-        draw_card_interactor = DrawCardInteractor(game_repo)
-        shuffle_discard_interactor = ShuffleDiscardInteractor(game_repo)
-        play_card_interactor = PlayCardInteractor(game_repo)
-        move_card_interactor = MoveCardInteractor(game_repo)
-        toggle_card_exhaustion_interactor = ToggleCardExhaustionInteractor(game_repo)
-        add_counter_interactor = AddCounterInteractor(game_repo)
-        delete_game_interactor = DeleteGameInteractor(game_repo)
-        
-        logger.info("✓ Interactors initialized (46 individual units)")
-        
-    except Exception as e:
-        logger.error(f"✗ Interactor initialization failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 7. INITIALIZE CONTROLLERS (REST Endpoints)
-    # ========================================================================
-    from src.controllers import card_bp, deck_bp, game_bp, lobby_bp
-    import src.controllers.card_controller as card_controller
-    import src.controllers.deck_controller as deck_controller
-    import src.controllers.game_controller as game_controller
-    import src.controllers.lobby_controller as lobby_controller
-    
-    try:
-        # Wire up card controller
-        card_controller.init_card_controller(
-            get_card_interactor,
-            search_cards_interactor,
-            import_card_interactor,
-            get_card_image_interactor
-        )
-        
-        # Wire up deck controller
-        deck_controller.init_deck_controller(
-            list_decks_interactor,
-            get_deck_interactor,
-            import_deck_interactor,
-            update_deck_interactor,
-            delete_deck_interactor
-        )
-        
-        # Wire up lobby controller
-        lobby_controller.init_lobby_controller(
-            create_lobby_interactor,
-            join_lobby_interactor,
-            leave_lobby_interactor,
-            choose_deck_interactor,
-            toggle_ready_interactor,
-            start_game_interactor,
-            build_encounter_deck_interactor,
-            list_lobbies_interactor,
-            delete_lobby_interactor
-        )
-        
-        # Wire up game controller
-        game_controller.init_game_controller(
-            list_games_interactor,
-            get_game_interactor,
-            draw_card_interactor,
-            shuffle_discard_interactor,
-            play_card_interactor,
-            move_card_interactor,
-            toggle_card_exhaustion_interactor,
-            add_counter_interactor,
-            delete_game_interactor
-        )
-        
-        logger.info("✓ Controllers initialized and wired")
-        
-    except Exception as e:
-        logger.error(f"✗ Controller initialization failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 8. REGISTER BLUEPRINTS
-    # ========================================================================
-    try:
-        app.register_blueprint(card_bp, url_prefix='/api/cards')
-        app.register_blueprint(deck_bp, url_prefix='/api/decks')
-        app.register_blueprint(game_bp, url_prefix='/api/games')
-        app.register_blueprint(lobby_bp, url_prefix='/api/lobby')
-        
-        logger.info("✓ Blueprints registered")
-        logger.info("  - /api/cards")
-        logger.info("  - /api/decks")
-        logger.info("  - /api/games")
-        logger.info("  - /api/lobby")
-    except Exception as e:
-        logger.error(f"✗ Blueprint registration failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 9. HEALTH CHECK ENDPOINT
-    # ========================================================================
-    @app.route('/health', methods=['GET'])
-    def health_check():
-        """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'version': '1.0.0',
-            'service': 'Marvel Champions API'
-        })
-    
-    logger.info("=" * 80)
-    logger.info("✓ APPLICATION READY")
-    logger.info("=" * 80)
-    
-    return app
-
-
-if __name__ == '__main__':
-    app = create_app()
-    app.run(host='0.0.0.0', port=5000, debug=True)
-''',
-
-    'src/controllers/card_controller.py': '''"""
+# Generated file contents (module-level so they are compiled once)
+_CARD_CONTROLLER_PY = '''"""
 Card Controller - REST API endpoints for card operations.
 
 Endpoints:
@@ -442,9 +145,9 @@ def get_card_image(code: str):
     except Exception as e:
         logger.error(f"Error fetching card image {code}: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
-''',
+'''
 
-    'src/controllers/deck_controller.py': '''"""
+_DECK_CONTROLLER_PY = '''"""
 Deck Controller - REST API endpoints for deck operations.
 
 Endpoints:
@@ -612,9 +315,9 @@ def delete_deck(deck_id: str):
     except Exception as e:
         logger.error(f"Error deleting deck: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
-''',
+'''
 
-    'src/controllers/game_controller.py': '''"""
+_GAME_CONTROLLER_PY = '''"""
 Game Controller - REST API endpoints for game operations.
 
 Endpoints:
@@ -896,9 +599,9 @@ def delete_game(game_id: str):
     except Exception as e:
         logger.error(f"Error deleting game: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
-''',
+'''
 
-    'src/controllers/lobby_controller.py': '''"""
+_LOBBY_CONTROLLER_PY = '''"""
 Lobby Controller - REST API endpoints for lobby operations.
 
 Endpoints:
@@ -1187,27 +890,102 @@ def delete_lobby(lobby_id):
     except Exception as e:
         logger.error(f"Error deleting lobby: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
-''',
+'''
+
+
+# Controller files to create/update
+# (src/app.py is maintained by hand; create_app lives only there)
+FILES = {
+    'src/controllers/card_controller.py': _CARD_CONTROLLER_PY,
+    'src/controllers/deck_controller.py': _DECK_CONTROLLER_PY,
+    'src/controllers/game_controller.py': _GAME_CONTROLLER_PY,
+    'src/controllers/lobby_controller.py': _LOBBY_CONTROLLER_PY,
 }
 
 
+def read_existing(file_path: str, limit: int):
+    """Read up to limit bytes of an existing file (None if missing)."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        chunks = []
+        remaining = limit
+        while remaining:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def write_file(file_path: str, content: str) -> str:
+    """Write one generated file and return its progress line.
+    
+    The parent directory must already exist (see create_directories).
+    """
+    try:
+        # Content is UTF-8 source text: encode once and skip the text-IO stack
+        encoded = content.encode('utf-8')
+        if read_existing(file_path, len(encoded) + 1) == encoded:
+            # Leave the file (and its mtime) alone
+            return f"✓ {file_path} (unchanged)"
+        
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            data = memoryview(encoded)
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        return f"✓ {file_path}"
+    except Exception as e:
+        return f"✗ {file_path}: {e}"
+
+
+async def write_files(files: dict) -> list:
+    """Write every file on a worker thread; results keep the input order."""
+    return list(await asyncio.gather(*(
+        asyncio.to_thread(write_file, file_path, content)
+        for file_path, content in files.items()
+    )))
+
+
+def leaf_directories(file_paths) -> list:
+    """
+    Get the parent directories of file_paths, minus any that is an
+    ancestor of another (makedirs on the leaf creates it anyway).
+    Deepest directories come first.
+    """
+    directories = {Path(file_path).parent for file_path in file_paths}
+    ancestors = {parent for directory in directories for parent in directory.parents}
+    return sorted(directories - ancestors, key=lambda d: len(d.parts), reverse=True)
+
+
+def create_directories():
+    """Create the parent directories of FILES with one makedirs per leaf."""
+    for directory in leaf_directories(FILES):
+        os.makedirs(directory, exist_ok=True)
+
+
 def main():
-    """Create or update all controller and app files."""
+    """Create or update all controller files."""
     total = len(FILES)
-    created = 0
+    create_directories()
     
-    for file_path, content in FILES.items():
-        try:
-            path = Path(file_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content)
-            print(f"✓ {file_path}")
-            created += 1
-        except Exception as e:
-            print(f"✗ {file_path}: {e}")
+    # Files are independent, so write them concurrently
+    results = asyncio.run(write_files(FILES))
+    
+    created = sum(1 for line in results if line.startswith('✓'))
+    results.append(f"\n✓ Created/updated {created}/{total} controller files")
     
-    print(f"\n✓ Created/updated {created}/{total} controller and app files")
+    # Emit all progress in one write rather than one flush per file
+    sys.stdout.write('\n'.join(results) + '\n')
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
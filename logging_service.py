@@ -1,17 +1,20 @@
 """
 Logging service for Marvel Champions with verbosity levels,
-file storage, and MongoDB redundancy.
+file storage, a Redis stream for high-volume logs, and MongoDB redundancy.
 """
 
 import logging
 import sys
 import os
 import datetime
+import time
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 import json
 import atexit
-from pymongo import MongoClient
+
+if TYPE_CHECKING:
+    import redis
 
 class LogLevel(Enum):
     """Verbosity levels for logging"""
@@ -22,11 +25,26 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL  # 50 - Critical errors
 
 
+# Redis connection pools shared by every LoggingService using the same URL
+_redis_pools: Dict[str, 'redis.ConnectionPool'] = {}
+
+
+def _get_redis_pool(redis_url: str) -> 'redis.ConnectionPool':
+    """Get (or create) the shared connection pool for a Redis URL"""
+    import redis
+    pool = _redis_pools.get(redis_url)
+    if pool is None:
+        pool = redis.ConnectionPool.from_url(redis_url)
+        _redis_pools[redis_url] = pool
+    return pool
+
+
 class LoggingService:
     """
     Centralized logging service with multiple backends:
     - Console output (with verbosity control)
     - File storage (rolling logs)
+    - Redis stream for DEBUG/INFO/WARNING (capped, when configured)
     - MongoDB redundancy (automatic sync on shutdown)
     """
     
@@ -36,7 +54,9 @@ class LoggingService:
                  log_dir: str = "logs",
                  mongo_connection: Optional[str] = None,
                  mongo_database: str = "marvel_champions",
-                 mongo_collection: str = "logs"):
+                 mongo_collection: str = "logs",
+                 redis_url: Optional[str] = None,
+                 redis_stream_maxlen: int = 100000):
         """
         Initialize the logging service.
         
@@ -47,6 +67,9 @@ class LoggingService:
             mongo_connection: MongoDB connection string (optional)
             mongo_database: MongoDB database name
             mongo_collection: MongoDB collection name for logs
+            redis_url: Redis URL for high-volume logs (optional). When set,
+                only ERROR/CRITICAL entries are buffered for MongoDB.
+            redis_stream_maxlen: Approximate cap on the Redis log stream
         """
         self.app_name = app_name
         self.verbosity = verbosity if isinstance(verbosity, LogLevel) else LogLevel(verbosity)
@@ -55,7 +78,10 @@ class LoggingService:
         self.mongo_database = mongo_database
         self.mongo_collection = mongo_collection
         self.db = None
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.redis = None
+        self.redis_stream = f"logs:{app_name}"
+        self.redis_stream_maxlen = redis_stream_maxlen
+        self.session_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_buffer = []  # Buffer logs for batch write to Mongo
         self.log_file = None
         
@@ -91,6 +117,8 @@ class LoggingService:
         
         # Setup MongoDB connection if provided
         if mongo_connection:
+            # Deferred so file/console-only logging never pays the pymongo import
+            from pymongo import MongoClient
             try:
                 client = MongoClient(mongo_connection, serverSelectionTimeoutMS=5000)
                 client.admin.command('ping')
@@ -99,6 +127,18 @@ class LoggingService:
             except Exception as e:
                 self.warning(f"MongoDB connection failed (logs will only be file-backed): {e}")
         
+        # Setup Redis stream if provided
+        if redis_url:
+            # Deferred like pymongo: redis is only needed when configured
+            import redis
+            try:
+                client = redis.Redis(connection_pool=_get_redis_pool(redis_url))
+                client.ping()
+                self.redis = client
+                self.debug(f"Redis log stream established: {self.redis_stream}")
+            except redis.RedisError as e:
+                self.warning(f"Redis connection failed (logs will go to MongoDB): {e}")
+        
         # Register shutdown handler to persist logs
         atexit.register(self._on_shutdown)
     
@@ -127,10 +167,15 @@ class LoggingService:
         # Log to Python logger
         self.python_logger.log(level.value, message)
         
+        # High-volume levels go to the capped Redis stream
+        if self.redis is not None and level.value < LogLevel.ERROR.value:
+            self._log_to_redis(level, message, **kwargs)
+            return
+        
         # Buffer for MongoDB
-        if self.db:
+        if self.db is not None:
             log_entry = {
-                'timestamp': datetime.datetime.utcnow(datetime.UTC),
+                'ts_ns': time.time_ns(),  # converted to a datetime on flush
                 'session_id': self.session_id,
                 'level': level.name,
                 'message': message,
@@ -139,10 +184,36 @@ class LoggingService:
             }
             self.log_buffer.append(log_entry)
     
+    def _log_to_redis(self, level: LogLevel, message: str, **kwargs):
+        """Append a log entry to the Redis stream"""
+        from redis import RedisError
+        fields = {
+            'session_id': self.session_id,
+            'level': level.name,
+            'message': message,
+            'app_name': self.app_name,
+        }
+        # Stream fields must be flat strings
+        fields.update({key: str(value) for key, value in kwargs.items()})
+        try:
+            self.redis.xadd(
+                self.redis_stream,
+                fields,
+                maxlen=self.redis_stream_maxlen,
+                approximate=True
+            )
+        except RedisError as e:
+            self.python_logger.error(f"Failed to write log to Redis: {e}")
+    
     def _on_shutdown(self):
         """Called on application shutdown to persist logs to MongoDB"""
-        if self.db and self.log_buffer:
+        if self.db is not None and self.log_buffer:
             try:
+                for entry in self.log_buffer:
+                    if 'ts_ns' in entry:
+                        entry['timestamp'] = datetime.datetime.fromtimestamp(
+                            entry.pop('ts_ns') / 1e9, tz=datetime.UTC
+                        )
                 collection = self.db[self.mongo_collection]
                 collection.insert_many(self.log_buffer)
                 self.python_logger.info(
@@ -156,11 +227,17 @@ class LoggingService:
         # Log session summary to file
         if self.log_file:
             try:
+                separator = '=' * 60
+                summary = '\n'.join([
+                    '',
+                    separator,
+                    f"Session ended at {datetime.datetime.now().isoformat()}",
+                    f"Total buffered logs: {len(self.log_buffer)}",
+                    separator,
+                    ''
+                ])
                 with open(self.log_file, 'a') as f:
-                    f.write(f"\n{'='*60}\n")
-                    f.write(f"Session ended at {datetime.now().isoformat()}\n")
-                    f.write(f"Total buffered logs: {len(self.log_buffer)}\n")
-                    f.write(f"{'='*60}\n")
+                    f.write(summary)
             except Exception:
                 pass
     
@@ -198,7 +275,8 @@ def initialize_logger(app_name: str = "marvel-champions",
                       log_dir: str = "logs",
                       mongo_connection: Optional[str] = None,
                       mongo_database: str = "marvel_champions",
-                      mongo_collection: str = "logs") -> LoggingService:
+                      mongo_collection: str = "logs",
+                      redis_url: Optional[str] = None) -> LoggingService:
     """Initialize and return the global logger instance"""
     global _logger_instance
     _logger_instance = LoggingService(
@@ -207,7 +285,8 @@ def initialize_logger(app_name: str = "marvel-champions",
         log_dir=log_dir,
         mongo_connection=mongo_connection,
         mongo_database=mongo_database,
-        mongo_collection=mongo_collection
+        mongo_collection=mongo_collection,
+        redis_url=redis_url
     )
     return _logger_instance
 
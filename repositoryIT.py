@@ -17,20 +17,23 @@ from repositories.mongo_deck_repository import MongoDeckRepository
 from repositories.mongo_game_repository import MongoGameRepository
 from entities import Card, Deck, DeckCard, Game, GameState, PlayerZones, CardInPlay, Position
 
+# One client for the whole run - every test draws connections from its pool
+client = MongoClient(
+    'mongodb://localhost:27017/',
+    serverSelectionTimeoutMS=2000,
+    maxPoolSize=50,
+    minPoolSize=5
+)
 
-def test_card_repository():
+
+def test_card_repository(db):
     """Test CardRepository CRUD operations"""
     print("\n" + "="*60)
     print("Testing Card Repository")
     print("="*60)
     
-    client = MongoClient('mongodb://localhost:27017/')
-    db = client['marvel_champions_test']
     repo = MongoCardRepository(db)
     
-    # Clean up first
-    db['cards'].delete_many({})
-    
     # Test 1: Save a card
     print("\n1. Testing save...")
     card = Card(code='01001a', name='Spider-Man (Peter Parker)', text='Friendly neighborhood hero')
@@ -81,19 +84,14 @@ def test_card_repository():
     print("\n✅ Card Repository tests passed!")
 
 
-def test_deck_repository():
+def test_deck_repository(db):
     """Test DeckRepository CRUD operations"""
     print("\n" + "="*60)
     print("Testing Deck Repository")
     print("="*60)
     
-    client = MongoClient('mongodb://localhost:27017/')
-    db = client['marvel_champions_test']
     repo = MongoDeckRepository(db)
     
-    # Clean up first
-    db['decks'].delete_many({})
-    
     # Test 1: Save a deck
     print("\n1. Testing save (new deck)...")
     deck = Deck(
@@ -154,19 +152,14 @@ def test_deck_repository():
     print("\n✅ Deck Repository tests passed!")
 
 
-def test_game_repository():
+def test_game_repository(db):
     """Test GameRepository CRUD operations"""
     print("\n" + "="*60)
     print("Testing Game Repository")
     print("="*60)
     
-    client = MongoClient('mongodb://localhost:27017/')
-    db = client['marvel_champions_test']
     repo = MongoGameRepository(db)
     
-    # Clean up first
-    db['games'].delete_many({})
-    
     # Test 1: Save a game (2 players)
     print("\n1. Testing save (new game)...")
     game = Game(
@@ -258,6 +251,11 @@ def test_game_repository():
     print("\n✅ Game Repository tests passed!")
 
 
+def reset_db(db):
+    """Drop the whole test database in a single round-trip"""
+    db.command('dropDatabase')
+
+
 def main():
     """Run all tests"""
     print("\n" + "="*60)
@@ -266,7 +264,6 @@ def main():
     
     try:
         # Test MongoDB connection
-        client = MongoClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=2000)
         client.server_info()
         print("\n✅ MongoDB connection successful")
     except Exception as e:
@@ -276,10 +273,12 @@ def main():
         print("  sudo systemctl start mongodb           (Linux)")
         return
     
+    db = client['marvel_champions_test']
+    reset_db(db)
     try:
-        test_card_repository()
-        test_deck_repository()
-        test_game_repository()
+        test_card_repository(db)
+        test_deck_repository(db)
+        test_game_repository(db)
         
         print("\n" + "="*60)
         print("✅ ALL TESTS PASSED!")
@@ -90,15 +90,22 @@ def setup_deck_models(api: Api, ns: Namespace) -> None:
         'updated_at': fields.DateTime(description='Last update timestamp')
     })
     
+    deck_summary_model = api.model('DeckSummary', {
+        'id': fields.String(description='Deck ID'),
+        'name': fields.String(description='Deck name'),
+        'card_count': fields.Integer(description='Total number of cards'),
+        'source_url': fields.String(description='MarvelCDB deck URL')
+    })
+    
     @ns.route('/')
     class DeckListResource(Resource):
         @ns.doc('list_decks')
-        @ns.marshal_list_with(deck_model)
+        @ns.marshal_list_with(deck_summary_model)
         def get(self):
             """List all decks
             
             Returns:
-                List of all available decks with full card information
+                Summary of each deck (no card entries), most recent first
             """
             pass
         
@@ -26,23 +26,24 @@ CONTROLLERS (REST Endpoints):
 
 import sys
 import os
+import weakref
 from pathlib import Path
-
-# Ensure imports work from project root
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import logging
-from flask import Flask, jsonify
-from flask_cors import CORS
+from flask import Flask, Response, jsonify
 from pymongo import MongoClient
 
-# Configure logging first
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 80
+_STARTING = f"{_BANNER}\nMARVEL CHAMPIONS API - Starting Application\n{_BANNER}"
+_READY = f"{_BANNER}\n✓ APPLICATION READY\n{_BANNER}"
+
+
+def _close_services(services, mongo_client):
+    """Finish queued background work, then close the MongoDB client it uses"""
+    services.close()
+    mongo_client.close()
+
 
 def create_app(config_override=None):
     """
@@ -54,10 +55,14 @@ def create_app(config_override=None):
     Returns:
         Configured Flask application ready to run
     """
+    # Configure logging unless the host (gunicorn, tests) already has
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
     
-    logger.info("=" * 80)
-    logger.info("MARVEL CHAMPIONS API - Starting Application")
-    logger.info("=" * 80)
+    logger.info(_STARTING)
     
     # ========================================================================
     # 1. CONFIGURATION LOADING
@@ -66,11 +71,12 @@ def create_app(config_override=None):
     
     try:
         config = load_config()
-        logger.info(f"✓ Configuration loaded")
-        logger.info(f"  - Database: {config.mongo.database}")
-        logger.info(f"  - Host: {config.host}:{config.port}")
+        logger.info(
+            "✓ Configuration loaded\n  - Database: %s\n  - Host: %s:%s",
+            config.mongo.database, config.host, config.port
+        )
     except Exception as e:
-        logger.error(f"✗ Failed to load configuration: {e}")
+        logger.error("✗ Failed to load configuration: %s", e)
         raise
     
     # ========================================================================
@@ -79,232 +85,205 @@ def create_app(config_override=None):
     app = Flask(__name__)
     app.config['SECRET_KEY'] = config.secret_key
     app.config['DEBUG'] = config.debug
-    CORS(app)
+    # jsonify bodies are written in insertion order and never indented
+    # (Flask otherwise sorts keys, and indents in debug mode)
+    app.json.sort_keys = False
+    app.json.compact = True
+    from src.middleware import setup_cors, setup_compression
+    setup_cors(app, config.cors_origin)
+    setup_compression(app)
     logger.info("✓ Flask app created")
     
     # ========================================================================
-    # 3. INITIALIZE MONGODB
+    # 3. INITIALIZE MONGODB (connects on first use)
     # ========================================================================
+    # connect=False skips the startup handshake; the first repository query
+    # (or /health ping) opens the connection instead.
     try:
         mongo_client = MongoClient(
             config.mongo.connection_string,
             serverSelectionTimeoutMS=5000,
-            uuidRepresentation='standard'
+            uuidRepresentation='standard',
+            maxPoolSize=config.mongo.max_pool_size,
+            minPoolSize=config.mongo.min_pool_size,
+            maxIdleTimeMS=config.mongo.max_idle_time_ms,
+            waitQueueTimeoutMS=config.mongo.wait_queue_timeout_ms,
+            retryWrites=True,
+            connect=False
         )
-        # Test connection
-        mongo_client.admin.command('ping')
         db = mongo_client[config.mongo.database]
-        logger.info(f"✓ MongoDB connected to '{config.mongo.database}'")
-    except Exception as e:
-        logger.error(f"✗ MongoDB connection failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 4. INITIALIZE REPOSITORIES (Data Access Layer)
-    # ========================================================================
-    from src.repositories import (
-        MongoCardRepository,
-        MongoDeckRepository,
-        MongoGameRepository
-    )
-
-    try:
-        card_repo = MongoCardRepository(db)
-        deck_repo = MongoDeckRepository(db)
-        game_repo = MongoGameRepository(db)
-        logger.info("✓ Repositories initialized")
-        logger.info("  - MongoCardRepository")
-        logger.info("  - MongoDeckRepository")
-        logger.info("  - MongoGameRepository")
+        # Keep the one pooled client for the app's lifetime
+        app.mongo_client = mongo_client
+        logger.info("✓ MongoDB client created for '%s'", config.mongo.database)
     except Exception as e:
-        logger.error(f"✗ Repository initialization failed: {e}")
+        logger.error("✗ MongoDB client creation failed: %s", e)
         raise
     
     # ========================================================================
-    # 5. INITIALIZE GATEWAYS (Boundaries - External Services)
+    # 4-5. REPOSITORIES AND GATEWAYS (built on first use)
     # ========================================================================
-    from src.gateways import MarvelCDBClient, LocalImageStorage
+    # Repositories ensure collections/indexes when constructed and the
+    # gateways import the scraping stack, so both are built only once a
+    # controller that needs them is wired.
+    from src.services import Services
     
-    try:
-        marvelcdb_gateway = MarvelCDBClient(config.marvelcdb)
-        image_storage = LocalImageStorage(config.image_storage)
-        logger.info("✓ Gateways initialized")
-        logger.info(f"  - MarvelCDBClient ({config.marvelcdb.base_url})")
-        logger.info(f"  - LocalImageStorage ({config.image_storage.storage_path})")
-    except Exception as e:
-        logger.error(f"✗ Gateway initialization failed: {e}")
-        raise
+    services = Services(config, db)
+    # The services and the client (with its monitor threads) are shut down
+    # once: at process exit, when the app is garbage-collected, or when
+    # close_services() is called, so apps built and dropped (e.g. in
+    # tests) don't pile up clients or save threads.
+    app.close_services = weakref.finalize(app, _close_services, services, mongo_client)
     
     # ========================================================================
-    # 6. INITIALIZE INTERACTORS (Business Logic - 46 individual units)
+    # 6. INTERACTOR WIRING (Business Logic - built per controller on first use)
     # ========================================================================
-    from src.interactors.card import (
-        ImportCardInteractor, GetCardInteractor, SearchCardsInteractor, GetCardImageInteractor, SaveCardInteractor
-    )
-    from src.interactors.deck import (
-        ImportDeckInteractor, GetDeckInteractor, UpdateDeckInteractor, DeleteDeckInteractor, ListDecksInteractor, SaveDeckInteractor
-    )
-    from src.interactors.lobby import (
-        CreateLobbyInteractor, JoinLobbyInteractor, LeaveLobbyInteractor, GetLobbyInteractor, ChooseDeckInteractor,
-        ToggleReadyInteractor, StartGameInteractor, BuildEncounterDeckInteractor, ListLobbiesInteractor, DeleteLobbyInteractor,
-        ListSavedEncounterDecksInteractor, LoadSavedEncounterDeckInteractor
-    )
-    from src.interactors.game import (
-        CreateGameInteractor, GetGameInteractor, ListGamesInteractor, DrawCardInteractor, ShuffleDiscardInteractor,
-        PlayCardInteractor, MoveCardInteractor, ToggleCardExhaustionInteractor, AddCounterInteractor, DeleteGameInteractor
-    )
-    
-    try:
-        # Card Interactors
-        import_card_interactor = ImportCardInteractor(marvelcdb_gateway, image_storage)
-        get_card_interactor = GetCardInteractor(card_repo)
-        search_cards_interactor = SearchCardsInteractor(card_repo)
-        get_card_image_interactor = GetCardImageInteractor(marvelcdb_gateway, image_storage)
-        save_card_interactor = SaveCardInteractor(card_repo)
-        
-        # Deck Interactors
-        import_deck_interactor = ImportDeckInteractor(marvelcdb_gateway)
-        get_deck_interactor = GetDeckInteractor(deck_repo)
-        update_deck_interactor = UpdateDeckInteractor(deck_repo)
-        delete_deck_interactor = DeleteDeckInteractor(deck_repo)
-        list_decks_interactor = ListDecksInteractor(deck_repo)
-        save_deck_interactor = SaveDeckInteractor(deck_repo)
-        
-        # Lobby Interactors
-        create_lobby_interactor = CreateLobbyInteractor(game_repo)
-        join_lobby_interactor = JoinLobbyInteractor(game_repo)
-        leave_lobby_interactor = LeaveLobbyInteractor(game_repo)
-        get_lobby_interactor = GetLobbyInteractor(game_repo)
-        choose_deck_interactor = ChooseDeckInteractor(game_repo, deck_repo, marvelcdb_gateway)
-        toggle_ready_interactor = ToggleReadyInteractor(game_repo)
-        start_game_interactor = StartGameInteractor(game_repo)
-        build_encounter_deck_interactor = BuildEncounterDeckInteractor(deck_repo, marvelcdb_gateway)
-        list_lobbies_interactor = ListLobbiesInteractor(game_repo)
-        delete_lobby_interactor = DeleteLobbyInteractor(game_repo)
-        save_encounter_deck_interactor = SaveDeckInteractor(deck_repo),
-        list_saved_encounter_decks_interactor = ListSavedEncounterDecksInteractor(deck_repo),
-        load_saved_encounter_deck_interactor = LoadSavedEncounterDeckInteractor(deck_repo)
-        
-        # Game Interactors
-        create_game_interactor = CreateGameInteractor(game_repo, deck_repo)
-        get_game_interactor = GetGameInteractor(game_repo)
-        list_games_interactor = ListGamesInteractor(game_repo)
-        draw_card_interactor = DrawCardInteractor(game_repo)
-        shuffle_discard_interactor = ShuffleDiscardInteractor(game_repo)
-        play_card_interactor = PlayCardInteractor(game_repo)
-        move_card_interactor = MoveCardInteractor(game_repo)
-        toggle_card_exhaustion_interactor = ToggleCardExhaustionInteractor(game_repo)
-        add_counter_interactor = AddCounterInteractor(game_repo)
-        delete_game_interactor = DeleteGameInteractor(game_repo)
-        
-        logger.info("✓ Interactors initialized (46 individual units)")
+    def wire_card_controller():
+        from src.interactors.card import (
+            ImportCardInteractor, GetCardInteractor, SearchCardsInteractor, GetCardImageInteractor, SaveCardInteractor,
+            ExportCardsInteractor
+        )
+        import src.controllers.card_controller as card_controller
         
-    except Exception as e:
-        logger.error(f"✗ Interactor initialization failed: {e}")
-        raise
-    
-    # ========================================================================
-    # 7. INITIALIZE CONTROLLERS (REST Endpoints)
-    # ========================================================================
-    from src.controllers import card_bp, deck_bp, game_bp, lobby_bp
-    import src.controllers.card_controller as card_controller
-    import src.controllers.deck_controller as deck_controller
-    import src.controllers.game_controller as game_controller
-    import src.controllers.lobby_controller as lobby_controller
-    
-    try:
-        # Wire up card controller
+        card_repo = services.card_repo
+        marvelcdb_gateway = services.marvelcdb_gateway
+        image_storage = services.image_storage
         card_controller.init_card_controller(
-            get_card_interactor,
-            search_cards_interactor,
-            import_card_interactor,
-            get_card_image_interactor,
-            save_card_interactor
+            GetCardInteractor(card_repo),
+            SearchCardsInteractor(card_repo),
+            ImportCardInteractor(marvelcdb_gateway, image_storage),
+            GetCardImageInteractor(marvelcdb_gateway, image_storage),
+            SaveCardInteractor(card_repo),
+            ExportCardsInteractor(card_repo)
+        )
+    
+    def wire_deck_controller():
+        from src.interactors.deck import (
+            ImportDeckInteractor, GetDeckInteractor, UpdateDeckInteractor, DeleteDeckInteractor, ListDecksInteractor, SaveDeckInteractor
         )
+        import src.controllers.deck_controller as deck_controller
         
-        # Wire up deck controller
+        deck_repo = services.deck_repo
         deck_controller.init_deck_controller(
-            list_decks_interactor,
-            get_deck_interactor,
-            import_deck_interactor,
-            update_deck_interactor,
-            delete_deck_interactor,
-            save_deck_interactor
+            ListDecksInteractor(deck_repo),
+            GetDeckInteractor(deck_repo),
+            ImportDeckInteractor(services.marvelcdb_gateway),
+            UpdateDeckInteractor(deck_repo),
+            DeleteDeckInteractor(deck_repo),
+            SaveDeckInteractor(deck_repo),
+            services.save_executor
+        )
+    
+    def wire_lobby_controller():
+        from src.interactors.deck import SaveDeckInteractor
+        from src.interactors.lobby import (
+            CreateLobbyInteractor, JoinLobbyInteractor, LeaveLobbyInteractor, GetLobbyInteractor, ChooseDeckInteractor,
+            ToggleReadyInteractor, StartGameInteractor, BuildEncounterDeckInteractor, ListLobbiesInteractor, DeleteLobbyInteractor,
+            ListSavedEncounterDecksInteractor, LoadSavedEncounterDeckInteractor, WatchLobbiesInteractor
         )
+        import src.controllers.lobby_controller as lobby_controller
         
-        # Wire up lobby controller
+        game_repo = services.game_repo
+        deck_repo = services.deck_repo
+        marvelcdb_gateway = services.marvelcdb_gateway
         lobby_controller.init_lobby_controller(
-            create_lobby_interactor,
-            join_lobby_interactor,
-            leave_lobby_interactor,
-            get_lobby_interactor,
-            choose_deck_interactor,
-            toggle_ready_interactor,
-            start_game_interactor,
-            build_encounter_deck_interactor,
-            list_lobbies_interactor,
-            delete_lobby_interactor,
-            save_encounter_deck_interactor,
-            list_saved_encounter_decks_interactor,
-            load_saved_encounter_deck_interactor
+            CreateLobbyInteractor(game_repo),
+            JoinLobbyInteractor(game_repo),
+            LeaveLobbyInteractor(game_repo),
+            GetLobbyInteractor(game_repo),
+            ChooseDeckInteractor(game_repo, deck_repo, marvelcdb_gateway),
+            ToggleReadyInteractor(game_repo),
+            StartGameInteractor(game_repo),
+            BuildEncounterDeckInteractor(deck_repo, marvelcdb_gateway),
+            ListLobbiesInteractor(game_repo),
+            DeleteLobbyInteractor(game_repo),
+            SaveDeckInteractor(deck_repo),
+            ListSavedEncounterDecksInteractor(deck_repo),
+            LoadSavedEncounterDeckInteractor(deck_repo),
+            WatchLobbiesInteractor(game_repo)
         )
+    
+    def wire_game_controller():
+        from src.interactors.game import (
+            GetGameInteractor, ListGamesInteractor, DrawCardInteractor, ShuffleDiscardInteractor,
+            PlayCardInteractor, MoveCardInteractor, ToggleCardExhaustionInteractor, AddCounterInteractor, DeleteGameInteractor
+        )
+        import src.controllers.game_controller as game_controller
         
-        # Wire up game controller
+        game_repo = services.game_repo
         game_controller.init_game_controller(
-            list_games_interactor,
-            get_game_interactor,
-            draw_card_interactor,
-            shuffle_discard_interactor,
-            play_card_interactor,
-            move_card_interactor,
-            toggle_card_exhaustion_interactor,
-            add_counter_interactor,
-            delete_game_interactor
+            ListGamesInteractor(game_repo),
+            GetGameInteractor(game_repo),
+            DrawCardInteractor(game_repo),
+            ShuffleDiscardInteractor(game_repo),
+            PlayCardInteractor(game_repo),
+            MoveCardInteractor(game_repo),
+            ToggleCardExhaustionInteractor(game_repo),
+            AddCounterInteractor(game_repo),
+            DeleteGameInteractor(game_repo)
         )
-        
-        logger.info("✓ Controllers initialized and wired")
-        
-    except Exception as e:
-        logger.error(f"✗ Controller initialization failed: {e}")
-        raise
+    
+    # ========================================================================
+    # 7. LOAD CONTROLLERS (REST Endpoints)
+    # ========================================================================
+    # Controller modules only define routes (they import no interactors),
+    # so they load eagerly; each one is wired on the first request it serves.
+    from src.controllers import card_bp, deck_bp, game_bp, lobby_bp
+    from src.controllers.registry import LazyControllerRegistry
+    import src.controllers.card_controller
+    import src.controllers.deck_controller
+    import src.controllers.game_controller
+    import src.controllers.lobby_controller
     
     # ========================================================================
     # 8. REGISTER BLUEPRINTS
     # ========================================================================
     try:
-        app.register_blueprint(card_bp, url_prefix='/api/cards')
-        app.register_blueprint(deck_bp, url_prefix='/api/decks')
-        app.register_blueprint(game_bp, url_prefix='/api/games')
-        app.register_blueprint(lobby_bp, url_prefix='/api/lobby')
+        controllers = LazyControllerRegistry(app)
+        controllers.register(card_bp, '/api/cards', wire_card_controller)
+        controllers.register(deck_bp, '/api/decks', wire_deck_controller)
+        controllers.register(game_bp, '/api/games', wire_game_controller)
+        controllers.register(lobby_bp, '/api/lobby', wire_lobby_controller)
         
-        logger.info("✓ Blueprints registered")
-        logger.info("  - /api/cards")
-        logger.info("  - /api/decks")
-        logger.info("  - /api/games")
-        logger.info("  - /api/lobby")
+        logger.info("✓ Blueprints registered\n  - /api/cards\n  - /api/decks\n  - /api/games\n  - /api/lobby")
     except Exception as e:
-        logger.error(f"✗ Blueprint registration failed: {e}")
+        logger.error("✗ Blueprint registration failed: %s", e)
         raise
     
     # ========================================================================
     # 9. HEALTH CHECK ENDPOINT
     # ========================================================================
+    from src.dto import encode_json
+    
+    # The healthy reply never changes, so it is encoded once
+    healthy_body = encode_json({
+        'status': 'healthy',
+        'version': '1.0.0',
+        'service': 'Marvel Champions API'
+    })
+    
     @app.route('/health', methods=['GET'])
     def health_check():
-        """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'version': '1.0.0',
-            'service': 'Marvel Champions API'
-        })
+        """Health check endpoint (pings MongoDB)"""
+        try:
+            mongo_client.admin.command('ping')
+        except Exception as e:
+            logger.warning("Health check failed: %s", e)
+            return jsonify({
+                'status': 'unhealthy',
+                'version': '1.0.0',
+                'service': 'Marvel Champions API',
+                'error': str(e)
+            }), 503
+        return Response(healthy_body, mimetype='application/json')
     
-    logger.info("=" * 80)
-    logger.info("✓ APPLICATION READY")
-    logger.info("=" * 80)
+    logger.info(_READY)
     
     return app
 
 
 if __name__ == '__main__':
+    # Run as a script (python src/app.py), the project root isn't on
+    # sys.path; installed or imported as src.app, it already is
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     app = create_app()
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator, Set
 from src.entities import Card
 
 class CardRepository(ABC):
@@ -12,9 +12,18 @@ class CardRepository(ABC):
     
     @abstractmethod
     def find_by_codes(self, codes: List[str]) -> List[Card]:
-        """Find multiple cards by their codes"""
+        """
+        Find multiple cards by their codes.
+        
+        Implementations must fetch every code in a single query (an $in
+        filter, SQL IN, a multi-get), not one lookup per code.
+        """
         pass
     
+    def find_missing_codes(self, codes: List[str]) -> Set[str]:
+        """Get the codes that have no stored card, in a single lookup"""
+        return set(codes) - {card.code for card in self.find_by_codes(codes)}
+    
     @abstractmethod
     def save(self, card: Card) -> Card:
         """Save a card and return the saved entity"""
@@ -22,7 +31,12 @@ class CardRepository(ABC):
     
     @abstractmethod
     def save_all(self, cards: List[Card]) -> List[Card]:
-        """Save multiple cards"""
+        """
+        Save multiple cards.
+        
+        Implementations must write the whole batch in at most one database
+        operation, not one save per card.
+        """
         pass
     
     @abstractmethod
@@ -35,7 +49,17 @@ class CardRepository(ABC):
         """Find all cards with pagination"""
         pass
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Card]:
+        """Iterate over every card, ordered by code"""
+        return iter(self.find_all(limit=0))
+    
     @abstractmethod
-    def search_by_name(self, name: str) -> List[Card]:
-        """Search cards by name (partial match)"""
+    def search_by_name(self, name: str, limit: int = 50, offset: int = 0) -> List[Card]:
+        """
+        Search cards by name (partial match), one page at a time, ordered by code.
+        
+        Search runs on every keystroke of the UI's card lookup, so it should
+        be answered from an index (e.g. trigrams of the names) rather than
+        by scanning every stored card per query.
+        """
         pass
\ No newline at end of file
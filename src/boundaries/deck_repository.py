@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from src.entities import Deck, DeckList, EncounterDeck
+from typing import Optional, List, Union, Iterator
+from src.entities import Deck, DeckList, DeckSummary, EncounterDeck
 
 class DeckRepository(ABC):
     """Repository interface for Deck entity"""
@@ -18,21 +18,52 @@ class DeckRepository(ABC):
         """
         pass
     
+    def find_by_ids(self, deck_ids: List[str]) -> List[DeckList]:
+        """
+        Find several decks at once
+        
+        Args:
+            deck_ids: Deck identifiers
+            
+        Returns:
+            The decks that exist, in the order of deck_ids
+        """
+        decks = (self.find_by_id(deck_id) for deck_id in deck_ids)
+        return [deck for deck in decks if deck is not None]
+    
     @abstractmethod
     def save(self, deck_list: DeckList) -> DeckList:
         """Save a deck list and return the saved entity"""
         pass
 
+    def save_many(self, deck_lists: List[DeckList]) -> List[DeckList]:
+        """Save several deck lists and return the saved entities"""
+        return [self.save(deck_list) for deck_list in deck_lists]
+
     @abstractmethod
     def delete(self, deck_id: str) -> bool:
         """Delete a deck by ID"""
         pass
     
     @abstractmethod
-    def find_all(self) -> List[DeckList]:
-        """Find all decks"""
+    def find_all(self, summary: bool = False,
+                 limit: Optional[int] = None) -> List[Union[DeckList, DeckSummary]]:
+        """
+        Find all decks, most recently updated first
+        
+        Args:
+            summary: Return DeckSummary entries instead of full deck lists
+            limit: Maximum number of decks to return
+            
+        Returns:
+            List of DeckList (or DeckSummary) entities
+        """
         pass
 
+    def iter_all(self) -> Iterator[DeckList]:
+        """Iterate over all decks, most recently updated first"""
+        return iter(self.find_all())
+
     def find_all_modules(self) -> List[DeckList]:
         """Find all encounter modules"""
         pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterable, Tuple, Union
 import uuid
-from src.entities import Game
+from src.entities import Game, GameSummary
 
 class GameRepository(ABC):
     """Repository interface for Game entity"""
@@ -11,22 +11,57 @@ class GameRepository(ABC):
         """Find a game by its ID"""
         pass
     
+    def find_by_ids(self, game_ids: List[uuid.UUID]) -> List[Game]:
+        """Find several games at once, in the order of game_ids"""
+        games = (self.find_by_id(game_id) for game_id in game_ids)
+        return [game for game in games if game is not None]
+    
     @abstractmethod
     def save(self, game: Game) -> Game:
         """Save a game and return the saved entity"""
         pass
     
+    def save_many(self, games: List[Game]) -> List[Game]:
+        """Save several games and return the saved entities"""
+        return [self.save(game) for game in games]
+    
     @abstractmethod
     def delete(self, game_id: str) -> bool:
         """Delete a game by ID"""
         pass
     
     @abstractmethod
-    def find_all(self) -> List[Game]:
-        """Find all games"""
+    def find_all(self, summary: bool = False) -> List[Union[Game, GameSummary]]:
+        """
+        Find all games, most recently updated first
+        
+        Args:
+            summary: Return GameSummary entries instead of full games
+            
+        Returns:
+            List of Game (or GameSummary) entities
+        """
         pass
     
     @abstractmethod
     def find_recent(self, limit: int = 10) -> List[Game]:
         """Find recent games"""
         pass
+    
+    @abstractmethod
+    def watch(self) -> Iterable[Tuple[str, uuid.UUID, Optional[Game]]]:
+        """
+        Block and yield lobby changes as they happen.
+        
+        Only lobby games, games leaving the lobby and deletes are
+        yielded; changes to games in progress are not. Implementations
+        start watching before returning, so a store that can't watch
+        fails on the call rather than on the first change, and return an
+        iterable with a close() that stops watching even if it was never
+        iterated.
+        
+        Yields:
+            (operation, game_id, game) where operation is 'insert', 'update'
+            or 'delete' and game is None for deletes
+        """
+        pass
@@ -1,6 +1,7 @@
 from PIL import Image
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from io import BytesIO
+from typing import BinaryIO, Optional, List, Tuple
 
 
 class ImageStorage(ABC):
@@ -36,6 +37,40 @@ class ImageStorage(ABC):
         """
         pass
     
+    def get_image_bytes(self, card_code: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a card image as stored, without decoding it.
+        
+        Args:
+            card_code: Unique card identifier
+            
+        Returns:
+            (image bytes, mimetype), or None if not found
+        """
+        image = self.get_image(card_code)
+        if image is None:
+            return None
+        buffer = BytesIO()
+        image.save(buffer, 'PNG')
+        return buffer.getvalue(), 'image/png'
+    
+    def open_image_stream(self, card_code: str) -> Optional[Tuple[BinaryIO, str]]:
+        """
+        Open a card image for streaming, without reading it into memory.
+        
+        Args:
+            card_code: Unique card identifier
+            
+        Returns:
+            (readable binary stream, mimetype), or None if not found.
+            The caller closes the stream.
+        """
+        stored = self.get_image_bytes(card_code)
+        if stored is None:
+            return None
+        data, mimetype = stored
+        return BytesIO(data), mimetype
+    
     @abstractmethod
     def image_exists(self, card_code: str) -> bool:
         """Check if an image exists for a card"""
@@ -10,6 +10,14 @@ class MongoConfig:
     database: str
     username: str | None
     password: str | None
+    # Connection pool. Under concurrent load the pool ceiling, not CPU, is
+    # what throughput saturates against first, so keep WSGI workers *
+    # threads <= max_pool_size. min_pool_size keeps connections warm for
+    # bursty traffic.
+    max_pool_size: int = 100
+    min_pool_size: int = 10
+    max_idle_time_ms: int = 30000
+    wait_queue_timeout_ms: int = 2000
     
     @property
     def connection_string(self) -> str:
@@ -44,6 +52,7 @@ class AppConfig:
     mongo: MongoConfig
     marvelcdb: MarvelCDBConfig
     image_storage: ImageStorageConfig
+    cors_origin: str = '*'
 
 
 def load_config() -> AppConfig:
@@ -54,7 +63,11 @@ def load_config() -> AppConfig:
         port=int(os.getenv('MONGO_PORT', 27017)),
         database=os.getenv('MONGO_DATABASE', 'marvel_champions'),
         username=os.getenv('MONGO_USERNAME'),
-        password=os.getenv('MONGO_PASSWORD')
+        password=os.getenv('MONGO_PASSWORD'),
+        max_pool_size=int(os.getenv('MONGO_MAX_POOL_SIZE', 100)),
+        min_pool_size=int(os.getenv('MONGO_MIN_POOL_SIZE', 10)),
+        max_idle_time_ms=int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 30000)),
+        wait_queue_timeout_ms=int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', 2000))
     )
     
     marvelcdb_config = MarvelCDBConfig(
@@ -76,5 +89,6 @@ def load_config() -> AppConfig:
         port=int(os.getenv('APP_PORT', 5000)),
         mongo=mongo_config,
         marvelcdb=marvelcdb_config,
-        image_storage=image_storage_config
+        image_storage=image_storage_config,
+        cors_origin=os.getenv('CORS_ORIGIN', '*')
     )
@@ -6,22 +6,31 @@ Endpoints:
 - GET /api/cards/search?q=<query> - Search cards
 - POST /api/cards/import - Import card from MarvelCDB
 - GET /api/cards/<code>/image - Get card image
+- GET /api/cards/export - Stream every card as NDJSON
 """
 
-from flask import jsonify, request, send_file
+from flask import Response, jsonify, request, send_file, stream_with_context
 from src.controllers import card_bp
 from src.middleware import audit_endpoint
-from io import BytesIO
+from src.dto import (
+    json_response, encode_json, card_detail,
+    CardSearchResult, SearchCardsResponse, ImportCardResponse
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Search results per page, by default and at most
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = 200
+
 # Global interactors
 _get_card_interactor = None
 _search_cards_interactor = None
 _import_card_interactor = None
 _get_card_image_interactor = None
 _save_card_interactor = None
+_export_cards_interactor = None
 
 
 def init_card_controller(
@@ -29,15 +38,17 @@ def init_card_controller(
     search_cards_interactor,
     import_card_interactor,
     get_card_image_interactor,
-    save_card_interactor
+    save_card_interactor,
+    export_cards_interactor
 ):
     """Initialize controller with interactors."""
-    global _get_card_interactor, _search_cards_interactor, _import_card_interactor, _get_card_image_interactor, _save_card_interactor
+    global _get_card_interactor, _search_cards_interactor, _import_card_interactor, _get_card_image_interactor, _save_card_interactor, _export_cards_interactor
     _get_card_interactor = get_card_interactor
     _search_cards_interactor = search_cards_interactor
     _import_card_interactor = import_card_interactor
     _get_card_image_interactor = get_card_image_interactor
     _save_card_interactor = save_card_interactor
+    _export_cards_interactor = export_cards_interactor
 
 
 @card_bp.route('/<code>', methods=['GET'])
@@ -45,55 +56,73 @@ def init_card_controller(
 def get_card(code: str):
     """Get a card by its code."""
     try:
-        logger.info(f"Fetching card: {code}")
+        logger.info("Fetching card: %s", code)
         card = _get_card_interactor.execute(code)
         
         if not card:
-            logger.warning(f"Card not found: {code}, importing....")
+            logger.warning("Card not found: %s, importing....", code)
 
             card = _import_card_interactor.execute(code)
             _save_card_interactor.execute(card)
             if not card:
-                logger.warning(f"Card not found in MarvelCDB: {code}")
+                logger.warning("Card not found in MarvelCDB: %s", code)
                 return jsonify({'error': 'Card not found'}), 404
         
-        return jsonify({
-            'code': card.code,
-            'name': card.name,
-            'text': card.text
-        })
+        # Content ETag: revisits get a bodiless 304 until the card changes
+        response = json_response(card_detail(card))
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
-        logger.error(f"Error fetching card {code}: {e}", exc_info=True)
+        logger.error("Error fetching card %s: %s", code, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
 @card_bp.route('/search', methods=['GET'])
 @audit_endpoint('search_cards')
 def search_cards():
-    """Search for cards by name."""
+    """Search for cards by name, a page at a time (limit/offset)."""
     query = request.args.get('q', '')
+    limit = min(max(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), 1), SEARCH_MAX_PAGE_SIZE)
+    offset = max(request.args.get('offset', 0, type=int), 0)
     
     if not query:
         return jsonify({'error': 'Query parameter required'}), 400
     
     try:
-        logger.info(f"Searching cards: {query}")
-        results = _search_cards_interactor.execute(query)
+        logger.info("Searching cards: %s", query)
+        # One extra row tells whether there is a next page
+        results = _search_cards_interactor.execute(query, limit=limit + 1, offset=offset)
+        has_more = len(results) > limit
+        results = results[:limit]
         
-        return jsonify({
-            'results': [
-                {'code': c.code, 'name': c.name}
-                for c in results
-            ],
-            'count': len(results)
-        })
+        return json_response(SearchCardsResponse(
+            results=[CardSearchResult(c.code, c.name) for c in results],
+            count=len(results),
+            next_offset=offset + limit if has_more else None
+        ))
         
     except Exception as e:
-        logger.error(f"Error searching cards: {e}", exc_info=True)
+        logger.error("Error searching cards: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
+@card_bp.route('/export', methods=['GET'])
+@audit_endpoint('export_cards')
+def export_cards():
+    """Stream every card, one JSON object per line."""
+    logger.info("Exporting cards")
+    cards = _export_cards_interactor.execute()
+    
+    # Lines go out as the cursor yields them, so the catalog is never
+    # held in memory as a whole
+    lines = (
+        encode_json(card_detail(c)) + b'\n'
+        for c in cards
+    )
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+
 @card_bp.route('/import', methods=['POST'])
 @audit_endpoint('import_card')
 def import_card():
@@ -104,20 +133,13 @@ def import_card():
         return jsonify({'error': 'Card code required'}), 400
     
     try:
-        logger.info(f"Importing card: {data['code']}")
+        logger.info("Importing card: %s", data['code'])
         card = _import_card_interactor.execute(data['code'])
         
-        return jsonify({
-            'success': True,
-            'card': {
-                'code': card.code,
-                'name': card.name,
-                'text': card.text
-            }
-        })
+        return json_response(ImportCardResponse(success=True, card=card_detail(card)))
         
     except Exception as e:
-        logger.error(f"Error importing card: {e}", exc_info=True)
+        logger.error("Error importing card: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -126,18 +148,26 @@ def import_card():
 def get_card_image(code: str):
     """Get card image."""
     try:
-        logger.info(f"Fetching card image: {code}")
+        logger.info("Fetching card image: %s", code)
         image = _get_card_image_interactor.execute(code)
         
         if not image:
             return jsonify({'error': 'Image not found'}), 404
         
-        img_io = BytesIO()
-        image.save(img_io, 'PNG', quality=95)
-        img_io.seek(0)
-        
-        return send_file(img_io, mimetype='image/png')
+        # Stream the stored file as-is (the WSGI server's file wrapper can
+        # sendfile it). A card's image never changes, so the code is a valid
+        # ETag and the image can be cached for a year.
+        stream, mimetype = image
+        response = send_file(
+            stream,
+            mimetype=mimetype,
+            etag=f"image-{code}",
+            conditional=True,
+            max_age=31536000
+        )
+        response.cache_control.immutable = True
+        return response
         
     except Exception as e:
-        logger.error(f"Error fetching card image {code}: {e}", exc_info=True)
+        logger.error("Error fetching card image %s: %s", code, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
@@ -9,9 +9,16 @@ Endpoints:
 - DELETE /api/decks/<id> - Delete deck
 """
 
-from flask import jsonify, request
+from dataclasses import replace
+import threading
+
+from flask import jsonify, request, url_for
 from src.controllers import deck_bp
 from src.middleware import audit_endpoint
+from src.dto import (
+    json_response, deck_summary_item,
+    ListDecksResponse, DeckDetail, ImportedDeck, ImportDeckResponse
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,6 +30,7 @@ _import_deck_interactor = None
 _update_deck_interactor = None
 _delete_deck_interactor = None
 _save_deck_interactor = None
+_save_executor = None
 
 def init_deck_controller(
     list_decks_interactor,
@@ -30,18 +38,46 @@ def init_deck_controller(
     import_deck_interactor,
     update_deck_interactor,
     delete_deck_interactor,
-    save_deck_interactor
+    save_deck_interactor,
+    save_executor
 ):
-    """Initialize controller with interactors."""
+    """Initialize controller with interactors and the background save executor."""
     global _list_decks_interactor, _get_deck_interactor, _import_deck_interactor, _update_deck_interactor, _delete_deck_interactor, _save_deck_interactor
+    global _save_executor
     _list_decks_interactor = list_decks_interactor
     _get_deck_interactor = get_deck_interactor
     _import_deck_interactor = import_deck_interactor
     _update_deck_interactor = update_deck_interactor
     _delete_deck_interactor = delete_deck_interactor
     _save_deck_interactor = save_deck_interactor
+    _save_executor = save_executor
+
+
+# Decks imported on a GET are saved in the background, so the response
+# isn't held up by the write. Until a save lands, the deck is served from
+# here; the executor is shut down (finishing queued saves) with the app.
+_pending_saves = {}
+_pending_saves_lock = threading.Lock()
 
 
+def _save_in_background(deck):
+    """Queue a save of deck, unless one for the same deck is already queued"""
+    with _pending_saves_lock:
+        if deck.id in _pending_saves:
+            return
+        _pending_saves[deck.id] = deck
+    
+    def save():
+        try:
+            _save_deck_interactor.execute(deck)
+        except Exception as e:
+            logger.error("Error saving imported deck %s: %s", deck.id, e)
+        finally:
+            with _pending_saves_lock:
+                _pending_saves.pop(deck.id, None)
+    
+    _save_executor.submit(save)
+
 
 @deck_bp.route('', methods=['GET'])
 @audit_endpoint('list_decks')
@@ -51,21 +87,16 @@ def list_decks():
         logger.info("Fetching all decks")
         decks = _list_decks_interactor.execute()
         
-        return jsonify({
-            'decks': [
-                {
-                    'id': deck.id,
-                    'name': deck.name,
-                    'card_count': deck.card_count(),
-                    'source_url': f"https://marvelcdb.com/deck/view/{deck.id}"
-                }
-                for deck in decks
-            ],
-            'count': len(decks)
-        })
+        # Content ETag: polling clients get a bodiless 304 until the list changes
+        response = json_response(ListDecksResponse(
+            decks=[deck_summary_item(deck) for deck in decks],
+            count=len(decks)
+        ))
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
-        logger.error(f"Error listing decks: {e}", exc_info=True)
+        logger.error("Error listing decks: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -74,27 +105,37 @@ def list_decks():
 def get_deck(deck_id: str):
     """Get a deck by ID. If the deck is not found locally, attempt to import from MarvelCDB, then save it locally."""
     try:
-        logger.info(f"Fetching deck: {deck_id}")
-        deck = _get_deck_interactor.execute(deck_id)
+        logger.info("Fetching deck: %s", deck_id)
+        # A deck imported by an earlier request may not be saved yet
+        with _pending_saves_lock:
+            deck = _pending_saves.get(deck_id)
+        if not deck:
+            deck = _get_deck_interactor.execute(deck_id)
         
         if not deck:
-            logger.warning(f"Deck not found, importing from marvelcdb: {deck_id}")
+            logger.warning("Deck not found, importing from marvelcdb: %s", deck_id)
             deck = _import_deck_interactor.execute(deck_id)
 
-            _save_deck_interactor.execute(deck)
-
             if not deck:
-                logger.warning(f"Deck not found in MarvelCDB: {deck_id}")
+                logger.warning("Deck not found in MarvelCDB: %s", deck_id)
                 return jsonify({'error': 'Deck not found'}), 404
+
+            _save_in_background(deck)
         
-        return jsonify({
-            'id': deck.id,
-            'name': deck.name,
-            'cards': deck.cards,
-        })
+        # Content ETag: revisits get a bodiless 304 until the deck changes
+        response = json_response(DeckDetail(id=deck.id, name=deck.name, cards=deck.cards))
+        # Clients fetch every card image next; preload hints let them (or
+        # a proxy sending 103 Early Hints) start before parsing the body
+        if deck.cards:
+            response.headers['Link'] = ', '.join(
+                f"<{url_for('card.get_card_image', code=code)}>; rel=preload; as=image"
+                for code in dict.fromkeys(c.code for c in deck.cards)
+            )
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
-        logger.error(f"Error fetching deck {deck_id}: {e}", exc_info=True)
+        logger.error("Error fetching deck %s: %s", deck_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -108,20 +149,16 @@ def import_deck():
         return jsonify({'error': 'deck_id required'}), 400
     
     try:
-        logger.info(f"Importing deck: {data['deck_id']}")
+        logger.info("Importing deck: %s", data['deck_id'])
         deck = _import_deck_interactor.execute(data['deck_id'])
         
-        return jsonify({
-            'success': True,
-            'deck': {
-                'id': deck.id,
-                'name': deck.name,
-                'card_count': deck.total_cards()
-            }
-        })
+        return json_response(ImportDeckResponse(
+            success=True,
+            deck=ImportedDeck(id=deck.id, name=deck.name, card_count=deck.total_cards())
+        ))
         
     except Exception as e:
-        logger.error(f"Error importing deck: {e}", exc_info=True)
+        logger.error("Error importing deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -132,7 +169,7 @@ def update_deck(deck_id: str):
     data = request.get_json()
     
     try:
-        logger.info(f"Updating deck: {deck_id}")
+        logger.info("Updating deck: %s", deck_id)
         deck = _get_deck_interactor.execute(deck_id)
         
         if not deck:
@@ -140,7 +177,6 @@ def update_deck(deck_id: str):
         
         # Update deck fields (simplified - adapt as needed)
         if 'name' in data:
-            from dataclasses import replace
             deck = replace(deck, name=data['name'])
         
         updated_deck = _update_deck_interactor.execute(deck)
@@ -154,7 +190,7 @@ def update_deck(deck_id: str):
         })
         
     except Exception as e:
-        logger.error(f"Error updating deck: {e}", exc_info=True)
+        logger.error("Error updating deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -163,7 +199,7 @@ def update_deck(deck_id: str):
 def delete_deck(deck_id: str):
     """Delete a deck."""
     try:
-        logger.info(f"Deleting deck: {deck_id}")
+        logger.info("Deleting deck: %s", deck_id)
         success = _delete_deck_interactor.execute(deck_id)
         
         if not success:
@@ -172,5 +208,5 @@ def delete_deck(deck_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error deleting deck: {e}", exc_info=True)
+        logger.error("Error deleting deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
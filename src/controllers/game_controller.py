@@ -16,11 +16,20 @@ Endpoints:
 from flask import jsonify, request
 from src.controllers import game_bp
 from src.middleware import audit_endpoint
+from src.dto import json_response, ListGamesResponse, game_summary_item
 from src.entities import Position
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Body fields each card action requires, and the error naming them
+_PLAY_REQUIRED = frozenset({'player_name', 'card_code', 'position'})
+_PLAY_REQUIRED_ERROR = 'player_name, card_code, position required'
+_MOVE_REQUIRED = frozenset({'card_code', 'position'})
+_MOVE_REQUIRED_ERROR = 'card_code, position required'
+_COUNTER_REQUIRED = frozenset({'card_code', 'counter_type'})
+_COUNTER_REQUIRED_ERROR = 'card_code, counter_type required'
+
 # Global interactors
 _list_games_interactor = None
 _get_game_interactor = None
@@ -73,21 +82,16 @@ def list_games():
         logger.info("Fetching all games")
         games = _list_games_interactor.execute()
         
-        return jsonify({
-            'games': [
-                {
-                    'id': str(game.id),
-                    'name': game.name,
-                    'phase': game.phase.value,
-                    'host': game.host,
-                }
-                for game in games
-            ],
-            'count': len(games)
-        })
+        # Content ETag: polling clients get a bodiless 304 until the list changes
+        response = json_response(ListGamesResponse(
+            games=[game_summary_item(game) for game in games],
+            count=len(games)
+        ))
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
-        logger.error(f"Error listing games: {e}", exc_info=True)
+        logger.error("Error listing games: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -96,21 +100,19 @@ def list_games():
 def get_game(game_id: str):
     """Get a game by ID."""
     try:
-        logger.info(f"Fetching game: {game_id}")
+        logger.info("Fetching game: %s", game_id)
         game = _get_game_interactor.execute(game_id)
         
         if not game:
             return jsonify({'error': 'Game not found'}), 404
         
-        return jsonify({
-            'id': str(game.id),
-            'name': game.name,
-            'phase': game.phase.value,
-            'host': game.host,
-        })
+        # Content ETag: polling clients get a bodiless 304 until the game changes
+        response = json_response(game_summary_item(game))
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
-        logger.error(f"Error fetching game: {e}", exc_info=True)
+        logger.error("Error fetching game: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -124,7 +126,7 @@ def draw_card(game_id: str):
         return jsonify({'error': 'player_name required'}), 400
     
     try:
-        logger.info(f"Drawing card for {data['player_name']}")
+        logger.info("Drawing card for %s", data['player_name'])
         game = _draw_card_interactor.execute(game_id, data['player_name'])
         
         if not game:
@@ -133,7 +135,7 @@ def draw_card(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error drawing card: {e}", exc_info=True)
+        logger.error("Error drawing card: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -147,7 +149,7 @@ def shuffle_discard(game_id: str):
         return jsonify({'error': 'player_name required'}), 400
     
     try:
-        logger.info(f"Shuffling discard for {data['player_name']}")
+        logger.info("Shuffling discard for %s", data['player_name'])
         game = _shuffle_discard_interactor.execute(game_id, data['player_name'])
         
         if not game:
@@ -156,7 +158,7 @@ def shuffle_discard(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error shuffling discard: {e}", exc_info=True)
+        logger.error("Error shuffling discard: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -166,12 +168,11 @@ def play_card(game_id: str):
     """Play a card to the table."""
     data = request.get_json()
     
-    required = ['player_name', 'card_code', 'position']
-    if not data or not all(k in data for k in required):
-        return jsonify({'error': f'{", ".join(required)} required'}), 400
+    if not data or not _PLAY_REQUIRED.issubset(data):
+        return jsonify({'error': _PLAY_REQUIRED_ERROR}), 400
     
     try:
-        logger.info(f"Playing card {data['card_code']}")
+        logger.info("Playing card %s", data['card_code'])
         position = Position(**data['position'])
         game = _play_card_interactor.execute(
             game_id, data['player_name'], data['card_code'], position
@@ -183,7 +184,7 @@ def play_card(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error playing card: {e}", exc_info=True)
+        logger.error("Error playing card: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -193,12 +194,11 @@ def move_card(game_id: str):
     """Move a card on the table."""
     data = request.get_json()
     
-    required = ['card_code', 'position']
-    if not data or not all(k in data for k in required):
-        return jsonify({'error': f'{", ".join(required)} required'}), 400
+    if not data or not _MOVE_REQUIRED.issubset(data):
+        return jsonify({'error': _MOVE_REQUIRED_ERROR}), 400
     
     try:
-        logger.info(f"Moving card {data['card_code']}")
+        logger.info("Moving card %s", data['card_code'])
         position = Position(**data['position'])
         game = _move_card_interactor.execute(game_id, data['card_code'], position)
         
@@ -208,7 +208,7 @@ def move_card(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error moving card: {e}", exc_info=True)
+        logger.error("Error moving card: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -222,7 +222,7 @@ def toggle_exhaustion(game_id: str):
         return jsonify({'error': 'card_code required'}), 400
     
     try:
-        logger.info(f"Toggling exhaustion for {data['card_code']}")
+        logger.info("Toggling exhaustion for %s", data['card_code'])
         game = _toggle_exhaustion_interactor.execute(game_id, data['card_code'])
         
         if not game:
@@ -231,7 +231,7 @@ def toggle_exhaustion(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error toggling exhaustion: {e}", exc_info=True)
+        logger.error("Error toggling exhaustion: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -241,12 +241,11 @@ def add_counter(game_id: str):
     """Add a counter to a card."""
     data = request.get_json()
     
-    required = ['card_code', 'counter_type']
-    if not data or not all(k in data for k in required):
-        return jsonify({'error': f'{", ".join(required)} required'}), 400
+    if not data or not _COUNTER_REQUIRED.issubset(data):
+        return jsonify({'error': _COUNTER_REQUIRED_ERROR}), 400
     
     try:
-        logger.info(f"Adding counter to {data['card_code']}")
+        logger.info("Adding counter to %s", data['card_code'])
         amount = data.get('amount', 1)
         game = _add_counter_interactor.execute(
             game_id, data['card_code'], data['counter_type'], amount
@@ -258,7 +257,7 @@ def add_counter(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error adding counter: {e}", exc_info=True)
+        logger.error("Error adding counter: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -267,7 +266,7 @@ def add_counter(game_id: str):
 def delete_game(game_id: str):
     """Delete a game."""
     try:
-        logger.info(f"Deleting game: {game_id}")
+        logger.info("Deleting game: %s", game_id)
         success = _delete_game_interactor.execute(game_id)
         
         if not success:
@@ -276,5 +275,5 @@ def delete_game(game_id: str):
         return jsonify({'success': True})
         
     except Exception as e:
-        logger.error(f"Error deleting game: {e}", exc_info=True)
+        logger.error("Error deleting game: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
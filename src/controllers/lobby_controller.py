@@ -11,11 +11,19 @@ Endpoints:
 - POST /api/lobby/<id>/ready - Toggle ready
 - POST /api/lobby/<id>/start - Start game
 - DELETE /api/lobby/<id> - Delete lobby
+- GET /api/lobby/stream - Server-sent lobby changes
 """
 
-from flask import jsonify, request
+from flask import jsonify, request, Response, stream_with_context
+from pymongo.errors import PyMongoError
 from src.controllers import lobby_bp
 from src.middleware import audit_endpoint
+from src.dto import (
+    json_response, encode_json, lobby_detail, lobby_players, lobby_summary,
+    LobbyChange, ListLobbiesResponse, CreateLobbyResponse,
+    LobbyPlayers, JoinLobbyResponse, LobbyPlayerName, LobbyPlayerNames,
+    LeaveLobbyResponse, ToggleReadyResponse, StartedGame, StartGameResponse
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,6 +42,7 @@ _delete_lobby_interactor = None
 _save_encounter_deck_interactor = None
 _list_saved_encounter_decks_interactor = None
 _load_saved_encounter_deck_interactor = None
+_watch_lobbies_interactor = None
 
 def init_lobby_controller(
     create_lobby_interactor,
@@ -48,7 +57,8 @@ def init_lobby_controller(
     delete_lobby_interactor,
     save_encounter_deck_interactor,
     list_saved_encounter_decks_interactor,
-    load_saved_encounter_deck_interactor 
+    load_saved_encounter_deck_interactor,
+    watch_lobbies_interactor
 ):
     """Initialize controller with interactors."""
     global _create_lobby_interactor
@@ -64,6 +74,7 @@ def init_lobby_controller(
     global _save_encounter_deck_interactor  
     global _list_saved_encounter_decks_interactor
     global _load_saved_encounter_deck_interactor 
+    global _watch_lobbies_interactor
     
     _create_lobby_interactor = create_lobby_interactor
     _join_lobby_interactor = join_lobby_interactor
@@ -78,6 +89,7 @@ def init_lobby_controller(
     _save_encounter_deck_interactor = save_encounter_deck_interactor
     _list_saved_encounter_decks_interactor = list_saved_encounter_decks_interactor
     _load_saved_encounter_deck_interactor = load_saved_encounter_deck_interactor 
+    _watch_lobbies_interactor = watch_lobbies_interactor
 
 
 @lobby_bp.route('', methods=['POST'])
@@ -90,22 +102,13 @@ def create_lobby():
         return jsonify({'error': 'name and username are required'}), 400
     
     try:
-        logger.info(f"Creating lobby: {data['name']} (host: {data['username']})")
+        logger.info("Creating lobby: %s (host: %s)", data['name'], data['username'])
         game = _create_lobby_interactor.execute(data['name'], data['username'])
         
-        return jsonify({
-            'success': True,
-            'lobby': {
-                'id': str(game.id),
-                'name': game.name,
-                'phase': game.phase.value,
-                'host': game.host,
-                'players': [{'name': p.name, 'is_ready': p.is_ready} for p in game.players],
-            }
-        })
+        return json_response(CreateLobbyResponse(lobby=lobby_detail(game)))
         
     except Exception as e:
-        logger.error(f"Error creating lobby: {e}", exc_info=True)
+        logger.error("Error creating lobby: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -114,48 +117,75 @@ def create_lobby():
 def list_lobbies():
     """Get all lobbies."""
     try:
-        logger.info("Fetching all lobbies")
+        logger.debug("Fetching all lobbies")
         lobbies = _list_lobbies_interactor.execute()
         
-        return jsonify({
-            'lobbies': [
-                {
-                    'id': str(g.id),
-                    'name': g.name,
-                    'host': g.host,
-                    'players': len(g.players),
-                    'phase': g.phase.value
-                }
+        return json_response(ListLobbiesResponse(
+            lobbies=[
+                lobby_summary(g)
                 for g in lobbies
             ],
-            'count': len(lobbies)
-        })
+            count=len(lobbies)
+        ))
         
     except Exception as e:
-        logger.error(f"Error listing lobbies: {e}", exc_info=True)
+        logger.error("Error listing lobbies: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
+@lobby_bp.route('/stream', methods=['GET'])
+@audit_endpoint('lobby_stream')
+def lobby_stream():
+    """
+    Push lobby changes as server-sent events.
+    
+    Replaces polling GET /api/lobby: each event carries only the lobby
+    that changed. Run under an eventlet/gevent worker so every open
+    stream is a cheap green thread.
+    """
+    try:
+        # Open the change stream before any header goes out, so a MongoDB
+        # that can't watch (e.g. not a replica set) gets a proper error
+        changes = _watch_lobbies_interactor.execute()
+    except PyMongoError as e:
+        logger.error("Error opening lobby stream: %s", e)
+        return jsonify({'error': 'Lobby stream unavailable'}), 503
+    
+    def generate():
+        try:
+            for operation, lobby_id, game in changes:
+                change = LobbyChange(
+                    op=operation,
+                    id=lobby_id,
+                    lobby=lobby_summary(game) if game else None
+                )
+                yield b'data: ' + encode_json(change) + b'\n\n'
+        except PyMongoError as e:
+            # Headers are already sent; tell the client the stream ended
+            logger.error("Lobby stream failed: %s", e)
+            yield b'event: error\ndata: ' + encode_json({'error': 'Lobby stream failed'}) + b'\n\n'
+    
+    logger.debug("Opening lobby stream")
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    # Runs even if the client leaves before the first event, when
+    # generate() never started and so can't clean up itself
+    response.call_on_close(changes.close)
+    return response
+
 @lobby_bp.route('/<lobby_id>', methods=['GET'])
 @audit_endpoint('get_lobby')
 def get_lobby(lobby_id):
     """Get lobby details."""
     try:
-        logger.info(f"Fetching lobby {lobby_id}")
+        logger.info("Fetching lobby %s", lobby_id)
         game = _get_lobby_interactor.execute(lobby_id)
         
         if not game:
             return jsonify({'error': 'Lobby not found'}), 404
         
-        return jsonify({
-            'id': str(game.id),
-            'name': game.name,
-            'host': game.host,
-            'phase': game.phase.value,
-            'players': [{'name': p.name, 'is_ready': p.is_ready} for p in game.players],
-        })
+        return json_response(lobby_detail(game))
         
     except Exception as e:
-        logger.error(f"Error fetching lobby: {e}", exc_info=True)
+        logger.error("Error fetching lobby: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 @lobby_bp.route('/<lobby_id>/join', methods=['POST'])
@@ -168,22 +198,18 @@ def join_lobby(lobby_id):
         return jsonify({'error': 'username required'}), 400
     
     try:
-        logger.info(f"Player {data['username']} joining lobby {lobby_id}")
+        logger.info("Player %s joining lobby %s", data['username'], lobby_id)
         game = _join_lobby_interactor.execute(lobby_id, data['username'])
         
-        return jsonify({
-            'success': True,
-            'lobby': {
-                'id': str(game.id),
-                'players': [{'name': p.name, 'is_ready': p.is_ready} for p in game.players],
-            }
-        })
+        return json_response(JoinLobbyResponse(
+            lobby=LobbyPlayers(id=str(game.id), players=lobby_players(game))
+        ))
         
     except ValueError as e:
-        logger.warning(f"Error joining lobby: {e}")
+        logger.warning("Error joining lobby: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error joining lobby: {e}", exc_info=True)
+        logger.error("Error joining lobby: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -197,22 +223,21 @@ def leave_lobby(lobby_id):
         return jsonify({'error': 'username required'}), 400
     
     try:
-        logger.info(f"Player {data['username']} leaving lobby {lobby_id}")
+        logger.info("Player %s leaving lobby %s", data['username'], lobby_id)
         game = _leave_lobby_interactor.execute(lobby_id, data['username'])
         
         if not game:
             return jsonify({'success': True, 'message': 'Lobby deleted'})
         
-        return jsonify({
-            'success': True,
-            'lobby': {
-                'id': str(game.id),
-                'players': [{'name': p.name} for p in game.players],
-            }
-        })
+        return json_response(LeaveLobbyResponse(
+            lobby=LobbyPlayerNames(
+                id=str(game.id),
+                players=[LobbyPlayerName(p.name) for p in game.players]
+            )
+        ))
         
     except Exception as e:
-        logger.error(f"Error leaving lobby: {e}", exc_info=True)
+        logger.error("Error leaving lobby: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -226,7 +251,7 @@ def choose_deck(lobby_id):
         return jsonify({'error': 'username and deck_id required'}), 400
     
     try:
-        logger.info(f"Player {data['username']} choosing deck {data['deck_id']}")
+        logger.info("Player %s choosing deck %s", data['username'], data['deck_id'])
         game = _choose_deck_interactor.execute(
             lobby_id, data['username'], data['deck_id']
         )
@@ -234,10 +259,10 @@ def choose_deck(lobby_id):
         return jsonify({'success': True})
         
     except ValueError as e:
-        logger.warning(f"Error choosing deck: {e}")
+        logger.warning("Error choosing deck: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error choosing deck: {e}", exc_info=True)
+        logger.error("Error choosing deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -251,22 +276,16 @@ def toggle_ready(lobby_id):
         return jsonify({'error': 'username required'}), 400
     
     try:
-        logger.info(f"Player {data['username']} toggling ready status")
+        logger.info("Player %s toggling ready status", data['username'])
         game = _toggle_ready_interactor.execute(lobby_id, data['username'])
         
-        return jsonify({
-            'success': True,
-            'players': [
-                {'name': p.name, 'is_ready': p.is_ready}
-                for p in game.players
-            ]
-        })
+        return json_response(ToggleReadyResponse(players=lobby_players(game)))
         
     except ValueError as e:
-        logger.warning(f"Error toggling ready: {e}")
+        logger.warning("Error toggling ready: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error toggling ready: {e}", exc_info=True)
+        logger.error("Error toggling ready: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -280,22 +299,18 @@ def start_game(lobby_id):
         return jsonify({'error': 'username required'}), 400
     
     try:
-        logger.info(f"Host {data['username']} starting game {lobby_id}")
+        logger.info("Host %s starting game %s", data['username'], lobby_id)
         game = _start_game_interactor.execute(lobby_id, data['username'])
         
-        return jsonify({
-            'success': True,
-            'game': {
-                'id': str(game.id),
-                'phase': game.phase.value
-            }
-        })
+        return json_response(StartGameResponse(
+            game=StartedGame(id=str(game.id), phase=game.phase.value)
+        ))
         
     except ValueError as e:
-        logger.warning(f"Error starting game: {e}")
+        logger.warning("Error starting game: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error starting game: {e}", exc_info=True)
+        logger.error("Error starting game: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -309,7 +324,7 @@ def delete_lobby(lobby_id):
         return jsonify({'error': 'username required'}), 400
     
     try:
-        logger.info(f"Deleting lobby {lobby_id}")
+        logger.info("Deleting lobby %s", lobby_id)
         success = _delete_lobby_interactor.execute(lobby_id, data['username'])
         
         if not success:
@@ -318,10 +333,10 @@ def delete_lobby(lobby_id):
         return jsonify({'success': True})
         
     except ValueError as e:
-        logger.warning(f"Error deleting lobby: {e}")
+        logger.warning("Error deleting lobby: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error deleting lobby: {e}", exc_info=True)
+        logger.error("Error deleting lobby: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 @lobby_bp.route('/encounter/save', methods=['POST'])
@@ -363,7 +378,7 @@ def save_encounter_deck():
         return jsonify({'error': 'name must be a non-empty string'}), 400
     
     try:
-        logger.info(f"Saving encounter deck '{name}' with modules: {module_names}")
+        logger.info("Saving encounter deck '%s' with modules: %s", name, module_names)
         encounter_deck = _save_encounter_deck_interactor.execute(
             module_names=module_names,
             save_name=name
@@ -381,10 +396,10 @@ def save_encounter_deck():
         })
         
     except ValueError as e:
-        logger.warning(f"Error saving encounter deck: {e}")
+        logger.warning("Error saving encounter deck: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error saving encounter deck: {e}", exc_info=True)
+        logger.error("Error saving encounter deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -419,7 +434,7 @@ def list_saved_encounter_decks():
         })
         
     except Exception as e:
-        logger.error(f"Error listing saved encounter decks: {e}", exc_info=True)
+        logger.error("Error listing saved encounter decks: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 
@@ -444,7 +459,7 @@ def load_saved_encounter_deck(name: str):
     } (404)
     """
     try:
-        logger.info(f"Loading saved encounter deck '{name}'")
+        logger.info("Loading saved encounter deck '%s'", name)
         modules = _load_saved_encounter_deck_interactor.execute(name)
         
         if modules is None:
@@ -456,5 +471,5 @@ def load_saved_encounter_deck(name: str):
         })
         
     except Exception as e:
-        logger.error(f"Error loading saved encounter deck: {e}", exc_info=True)
+        logger.error("Error loading saved encounter deck: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
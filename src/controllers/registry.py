@@ -0,0 +1,60 @@
+"""
+Lazy controller registry.
+
+Blueprints are registered with the app up front (a Flask app cannot
+register blueprints once it has served a request), but each controller's
+interactors are only built on the first request routed to its blueprint.
+Requests to /api/cards never pay for loading the lobby or game stacks.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict
+
+from flask import Blueprint, Flask, request
+
+logger = logging.getLogger(__name__)
+
+
+class LazyControllerRegistry:
+    """
+    Wires controllers on demand, keyed by blueprint name.
+
+    Example:
+        >>> registry = LazyControllerRegistry(app)
+        >>> registry.register(card_bp, '/api/cards', wire_card_controller)
+    """
+
+    def __init__(self, app: Flask):
+        self.app = app
+        self._wiring: Dict[str, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+        app.before_request(self._wire_for_request)
+
+    def register(self, blueprint: Blueprint, url_prefix: str, wire: Callable[[], None]):
+        """
+        Register a blueprint whose controller is wired on first use.
+
+        Args:
+            blueprint: Blueprint with the controller's routes
+            url_prefix: URL prefix to mount the blueprint under
+            wire: Builds the controller's interactors and calls its init_*_controller
+        """
+        self._wiring[blueprint.name] = wire
+        self.app.register_blueprint(blueprint, url_prefix=url_prefix)
+
+    def is_wired(self, blueprint_name: str) -> bool:
+        """Check whether a registered controller has been wired yet"""
+        return blueprint_name not in self._wiring
+
+    def _wire_for_request(self):
+        """Wire the controller behind this request if it hasn't been yet"""
+        if request.blueprint not in self._wiring:
+            return
+        with self._lock:
+            # Concurrent first requests wait here; only one does the wiring
+            wire = self._wiring.get(request.blueprint)
+            if wire is not None:
+                wire()
+                del self._wiring[request.blueprint]
+                logger.info("✓ Controller wired: %s", request.blueprint)
@@ -0,0 +1,72 @@
+from .json_response import json_response, encode_json
+from .card_responses import (
+    CardDetail,
+    CardSearchResult,
+    SearchCardsResponse,
+    ImportCardResponse,
+    card_detail
+)
+from .deck_responses import (
+    DeckSummaryItem,
+    ListDecksResponse,
+    DeckDetail,
+    ImportedDeck,
+    ImportDeckResponse,
+    deck_summary_item
+)
+from .game_responses import GameSummaryItem, ListGamesResponse, game_summary_item
+from .lobby_responses import (
+    LobbyPlayer,
+    LobbyPlayerName,
+    LobbySummary,
+    ListLobbiesResponse,
+    LobbyDetail,
+    CreateLobbyResponse,
+    LobbyPlayers,
+    JoinLobbyResponse,
+    LobbyPlayerNames,
+    LeaveLobbyResponse,
+    ToggleReadyResponse,
+    StartedGame,
+    StartGameResponse,
+    LobbyChange,
+    lobby_summary,
+    lobby_players,
+    lobby_detail
+)
+
+__all__ = [
+    'json_response',
+    'encode_json',
+    'CardDetail',
+    'CardSearchResult',
+    'SearchCardsResponse',
+    'ImportCardResponse',
+    'card_detail',
+    'DeckSummaryItem',
+    'ListDecksResponse',
+    'DeckDetail',
+    'ImportedDeck',
+    'ImportDeckResponse',
+    'deck_summary_item',
+    'GameSummaryItem',
+    'ListGamesResponse',
+    'game_summary_item',
+    'LobbyPlayer',
+    'LobbyPlayerName',
+    'LobbySummary',
+    'ListLobbiesResponse',
+    'LobbyDetail',
+    'CreateLobbyResponse',
+    'LobbyPlayers',
+    'JoinLobbyResponse',
+    'LobbyPlayerNames',
+    'LeaveLobbyResponse',
+    'ToggleReadyResponse',
+    'StartedGame',
+    'StartGameResponse',
+    'LobbyChange',
+    'lobby_summary',
+    'lobby_players',
+    'lobby_detail'
+]
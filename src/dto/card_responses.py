@@ -0,0 +1,37 @@
+"""
+Response DTOs for the card endpoints.
+"""
+
+from typing import List, Optional
+import msgspec
+
+
+class CardDetail(msgspec.Struct):
+    """GET /api/cards/<code>"""
+    code: str
+    name: str
+    text: Optional[str]
+
+
+class CardSearchResult(msgspec.Struct):
+    """One row of the card search results"""
+    code: str
+    name: str
+
+
+class SearchCardsResponse(msgspec.Struct):
+    """GET /api/cards/search"""
+    results: List[CardSearchResult]
+    count: int
+    next_offset: Optional[int] = None
+
+
+class ImportCardResponse(msgspec.Struct):
+    """POST /api/cards/import"""
+    success: bool
+    card: CardDetail
+
+
+def card_detail(card) -> CardDetail:
+    """Build the card detail for a card"""
+    return CardDetail(card.code, card.name, card.text)
@@ -0,0 +1,52 @@
+"""
+Response DTOs for the deck endpoints.
+"""
+
+from typing import List
+import msgspec
+
+from src.entities import DeckCard
+
+
+class DeckSummaryItem(msgspec.Struct):
+    """One row of the deck list"""
+    id: str
+    name: str
+    card_count: int
+    source_url: str
+
+
+class ListDecksResponse(msgspec.Struct):
+    """GET /api/decks"""
+    decks: List[DeckSummaryItem]
+    count: int
+
+
+class DeckDetail(msgspec.Struct):
+    """GET /api/decks/<deck_id>"""
+    id: str
+    name: str
+    cards: List[DeckCard]
+
+
+class ImportedDeck(msgspec.Struct):
+    """The deck in an import response"""
+    id: str
+    name: str
+    card_count: int
+
+
+class ImportDeckResponse(msgspec.Struct):
+    """POST /api/decks/import"""
+    success: bool
+    deck: ImportedDeck
+
+
+def deck_summary_item(deck) -> DeckSummaryItem:
+    """Build the deck list row for a deck or deck summary"""
+    return DeckSummaryItem(
+        id=deck.id,
+        name=deck.name,
+        card_count=deck.card_count(),
+        source_url=f"https://marvelcdb.com/deck/view/{deck.id}"
+    )
@@ -0,0 +1,25 @@
+"""
+Response DTOs for the game endpoints.
+"""
+
+from typing import List
+import msgspec
+
+
+class GameSummaryItem(msgspec.Struct):
+    """One row of the game list"""
+    id: str
+    name: str
+    phase: str
+    host: str
+
+
+class ListGamesResponse(msgspec.Struct):
+    """GET /api/games"""
+    games: List[GameSummaryItem]
+    count: int
+
+
+def game_summary_item(game) -> GameSummaryItem:
+    """Build the game list row for a game"""
+    return GameSummaryItem(str(game.id), game.name, game.phase.value, game.host)
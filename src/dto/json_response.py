@@ -0,0 +1,28 @@
+"""
+Fast JSON responses for typed response DTOs.
+"""
+
+import msgspec
+from flask import Response
+
+# Shared encoder - reuses its internal buffer across requests
+_encoder = msgspec.json.Encoder()
+
+
+def encode_json(payload) -> bytes:
+    """Encode a response DTO (or plain dict/list) to JSON bytes"""
+    return _encoder.encode(payload)
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Encode a response DTO (or plain dict/list) straight to a JSON Response.
+    
+    Args:
+        payload: msgspec Struct, dict or list to encode
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with application/json mimetype
+    """
+    return Response(_encoder.encode(payload), status=status, mimetype='application/json')
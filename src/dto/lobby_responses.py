@@ -0,0 +1,120 @@
+"""
+Response DTOs for the lobby endpoints.
+
+Structs have fixed fields (__slots__), so building them avoids the
+per-request dict allocation and hashing of nested jsonify payloads.
+"""
+
+from typing import List, Optional
+import msgspec
+
+
+class LobbyPlayer(msgspec.Struct):
+    """A player as shown inside a lobby"""
+    name: str
+    is_ready: bool
+
+
+class LobbyPlayerName(msgspec.Struct):
+    """A player reference without ready state"""
+    name: str
+
+
+class LobbySummary(msgspec.Struct):
+    """One row of the lobby list"""
+    id: str
+    name: str
+    host: str
+    players: int
+    phase: str
+
+
+class ListLobbiesResponse(msgspec.Struct):
+    """GET /api/lobby"""
+    lobbies: List[LobbySummary]
+    count: int
+
+
+class LobbyDetail(msgspec.Struct):
+    """Full lobby view"""
+    id: str
+    name: str
+    host: str
+    phase: str
+    players: List[LobbyPlayer]
+
+
+class CreateLobbyResponse(msgspec.Struct):
+    """POST /api/lobby"""
+    lobby: LobbyDetail
+    success: bool = True
+
+
+class LobbyPlayers(msgspec.Struct):
+    """Lobby id with its current players"""
+    id: str
+    players: List[LobbyPlayer]
+
+
+class JoinLobbyResponse(msgspec.Struct):
+    """POST /api/lobby/<id>/join"""
+    lobby: LobbyPlayers
+    success: bool = True
+
+
+class LobbyPlayerNames(msgspec.Struct):
+    """Lobby id with the names of its remaining players"""
+    id: str
+    players: List[LobbyPlayerName]
+
+
+class LeaveLobbyResponse(msgspec.Struct):
+    """POST /api/lobby/<id>/leave"""
+    lobby: LobbyPlayerNames
+    success: bool = True
+
+
+class ToggleReadyResponse(msgspec.Struct):
+    """POST /api/lobby/<id>/ready"""
+    players: List[LobbyPlayer]
+    success: bool = True
+
+
+class StartedGame(msgspec.Struct):
+    """Game id and phase after starting"""
+    id: str
+    phase: str
+
+
+class StartGameResponse(msgspec.Struct):
+    """POST /api/lobby/<id>/start"""
+    game: StartedGame
+    success: bool = True
+
+
+class LobbyChange(msgspec.Struct):
+    """One event of GET /api/lobby/stream"""
+    op: str
+    id: str
+    lobby: Optional[LobbySummary] = None
+
+
+def lobby_summary(game) -> LobbySummary:
+    """Build the lobby list row for a game"""
+    return LobbySummary(str(game.id), game.name, game.host, len(game.players), game.phase.value)
+
+
+def lobby_players(game) -> List[LobbyPlayer]:
+    """Build the player list for a game"""
+    return [LobbyPlayer(p.name, p.is_ready) for p in game.players]
+
+
+def lobby_detail(game) -> LobbyDetail:
+    """Build the full lobby view for a game"""
+    return LobbyDetail(
+        id=str(game.id),
+        name=game.name,
+        host=game.host,
+        phase=game.phase.value,
+        players=lobby_players(game)
+    )
@@ -3,14 +3,14 @@ Updated exports for simplified model
 """
 from .card import Card
 from .card_in_play import CardInPlay
-from .deck import Deck, DeckCard, DeckList
+from .deck import Deck, DeckCard, DeckList, DeckSummary
 from .deck_in_play import DeckInPlay
 from .dial import Dial
 from .token import Token
 from .position import Position, FlipState
 from .play_zone import PlayZone
 from .player import Player
-from .game import Game, GamePhase
+from .game import Game, GamePhase, GameSummary
 from .encounter_deck import EncounterDeck
 from .encounter_deck_in_play import EncounterDeckInPlay
 
@@ -19,6 +19,7 @@ __all__ = [
     'CardInPlay',
     'Deck',
     'DeckList',
+    'DeckSummary',
     'DeckCard',
     'DeckInPlay',
     'Dial',
@@ -30,6 +31,7 @@ __all__ = [
     'Player',
     'Game',
     'GamePhase',
+    'GameSummary',
     'EncounterDeck',
     'EncounterDeckInPlay'
 ]
\ No newline at end of file
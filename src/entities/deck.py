@@ -4,7 +4,7 @@ import datetime
 
 from src.entities.card import Card
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeckCard:
     """
     A single card entry in a deck with its quantity.
@@ -32,7 +32,7 @@ class DeckCard:
         if self.quantity < 1:
             raise ValueError("Card quantity must be at least 1")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeckList:
     """
     A simple list of DeckCard entries.
@@ -71,8 +71,31 @@ class DeckList:
         for card in self.cards:
             count += card.quantity
         return count
+
+
+@dataclass(frozen=True, slots=True)
+class DeckSummary:
+    """
+    Lightweight listing view of a stored deck.
+    
+    DeckSummary carries just what deck listings display, so listing
+    decks does not need to load every card entry of every deck.
+    
+    Attributes:
+        id: Unique identifier for the deck
+        name: Display name for the deck
+        total_quantity: Sum of all card quantities in the deck
+    """
+    id: str
+    name: str
+    total_quantity: int = 0
+    
+    def card_count(self) -> int:
+        """Get total number of cards in the deck."""
+        return self.total_quantity
+
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Deck:
     """
     A collection of cards forming a playable deck.
@@ -169,4 +169,25 @@ class Game:
             play_zone=new_play_zone,
             created_at=self.created_at,
             updated_at=datetime.datetime.now(datetime.UTC)
-        )
\ No newline at end of file
+        )
+
+@dataclass(frozen=True)
+class GameSummary:
+    """
+    Lightweight listing view of a stored game.
+    
+    GameSummary carries just what game listings display, so listing
+    games does not need to load every player, deck and play zone.
+    
+    Attributes:
+        id: Unique identifier for the game
+        name: Display name for the game
+        host: Name of the hosting player
+        phase: Current lifecycle phase
+        updated_at: When the game last changed
+    """
+    id: uuid.UUID
+    name: str
+    host: str
+    phase: GamePhase = GamePhase.LOBBY
+    updated_at: Optional[datetime.datetime] = None
@@ -1,11 +1,13 @@
 import os
 from pathlib import Path
-from typing import Optional, List
+from typing import BinaryIO, Optional, List, Tuple
 
 from PIL.Image import Image
 from src.config import ImageStorageConfig
 from src.boundaries.image_storage import ImageStorage
 
+_MIMETYPES = {'.jpg': 'image/jpeg', '.png': 'image/png'}
+
 
 class LocalImageStorage(ImageStorage):
     """
@@ -65,6 +67,37 @@ class LocalImageStorage(ImageStorage):
         
         return None
     
+    def get_image_bytes(self, card_code: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a card image's file contents and mimetype, without decoding it.
+        
+        Args:
+            card_code: Unique card identifier
+            
+        Returns:
+            (image bytes, mimetype), or None if not found
+        """
+        filepath = self.get_image_path(card_code)
+        if filepath is None:
+            return None
+        path = Path(filepath)
+        return path.read_bytes(), _MIMETYPES[path.suffix]
+    
+    def open_image_stream(self, card_code: str) -> Optional[Tuple[BinaryIO, str]]:
+        """
+        Open a card image file for streaming.
+        
+        Args:
+            card_code: Unique card identifier
+            
+        Returns:
+            (open binary file, mimetype), or None if not found
+        """
+        filepath = self.get_image_path(card_code)
+        if filepath is None:
+            return None
+        return open(filepath, 'rb'), _MIMETYPES[Path(filepath).suffix]
+    
     def image_exists(self, card_code: str) -> bool:
         """Check if an image exists for a card"""
         return self.get_image_path(card_code) is not None
@@ -1,10 +1,14 @@
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
+import threading
+from cachetools import TTLCache
 import io
 from PIL import Image
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from src.config import MarvelCDBConfig
@@ -15,6 +19,14 @@ from src.entities.encounter_deck import EncounterDeck
 from .local_image_storage import LocalImageStorage
 from playwright.sync_api import sync_playwright
 
+# (connect, read) seconds - a dead host fails fast, a slow page still loads
+_TIMEOUT = (3, 10)
+
+# Only the parts of MarvelCDB pages that are read get parsed into a tree;
+# the rest of the page (navigation, scripts, comments) is skipped
+_MODULE_TABLE = SoupStrainer('table')
+_CARD_FIELDS = SoupStrainer(class_=['card-name', 'card-text'])
+
 class MarvelCDBClient(MarvelCDBGateway):
     """
     Implementation of MarvelCDB gateway.
@@ -23,11 +35,29 @@ class MarvelCDBClient(MarvelCDBGateway):
     
     def __init__(self, config: MarvelCDBConfig):
         self.config = config
+        # One session for the client's lifetime keeps connections to
+        # MarvelCDB alive across fetches; transient gateway errors on these
+        # idempotent GETs are retried on a fresh connection
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False
+            )
+        ))
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         self.last_request_time = 0
+        # Fetched cards by code. Popular cards (basic resources) appear in
+        # most decks, so a deck import mostly hits this instead of the site.
+        # The TTL only bounds how long an errata'd card can be stale.
+        # TTLCache isn't thread-safe, so every access holds the lock.
+        self._card_cache = TTLCache(maxsize=4096, ttl=24 * 60 * 60)
+        self._card_cache_lock = threading.Lock()
     
     def _rate_limit(self):
         """Enforce rate limiting between requests"""
@@ -47,10 +77,10 @@ class MarvelCDBClient(MarvelCDBGateway):
         """
         self._rate_limit()
         url = f"{self.config.base_url}/find?q=m:{module_code}&view=list&decks=encounter"
-        response = self.session.get(url, timeout=10)
+        response = self.session.get(url, timeout=_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'html.parser', parse_only=_MODULE_TABLE)
         
         encounter_deck = EncounterDeck(
             id=module_code,
@@ -193,14 +223,19 @@ class MarvelCDBClient(MarvelCDBGateway):
     
     def get_card_from_code(self, card_code: str) -> Card:
         """Fetch card info from MarvelCDB by card code"""
+        with self._card_cache_lock:
+            cached = self._card_cache.get(card_code)
+        if cached is not None:
+            return cached
+        
         self._rate_limit()
         
         try:
             url = f"{self.config.base_url}/card/{card_code}"
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=_TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'html.parser', parse_only=_CARD_FIELDS)
             
             # Extract card name
             name = None
@@ -214,10 +249,14 @@ class MarvelCDBClient(MarvelCDBGateway):
             if text_elem:
                 text = text_elem.get_text(strip=True)
             
-            return Card(
+            card = Card(
                 code=card_code,
                 name=name if name else card_code,
                 text=text)
+            # Only real cards are cached; a failed fetch is retried next time
+            with self._card_cache_lock:
+                self._card_cache[card_code] = card
+            return card
             
         except requests.RequestException as e:
             print(f"Error fetching card info: {e}")
@@ -244,8 +283,9 @@ class MarvelCDBClient(MarvelCDBGateway):
 
         url = f"{self.config.base_url}/bundles/cards/{card_code}.png"
         
-        # 2. Send a GET request to the URL, streaming the response content
-        response = requests.get(url, stream=True, timeout=10)
+        # 2. Send a GET request to the URL over the pooled session, so
+        # repeated image downloads reuse the same keep-alive connection
+        response = self.session.get(url, stream=True, timeout=_TIMEOUT)
         response.raise_for_status()
         
         # 3. Check if the request was successful (status code 200)
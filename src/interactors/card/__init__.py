@@ -3,11 +3,13 @@ from .get_card import GetCardInteractor
 from .search_cards import SearchCardsInteractor
 from .get_card_image import GetCardImageInteractor
 from .save_card import SaveCardInteractor
+from .export_cards import ExportCardsInteractor
 
 __all__ = [
     'ImportCardInteractor',
     'GetCardInteractor',
     'SearchCardsInteractor',
     'GetCardImageInteractor',
-    'SaveCardInteractor'
+    'SaveCardInteractor',
+    'ExportCardsInteractor'
 ]
@@ -0,0 +1,20 @@
+"""Interactor to export every card."""
+from typing import Iterator
+from src.entities import Card
+from src.boundaries.card_repository import CardRepository
+
+
+class ExportCardsInteractor:
+    """Stream the whole card catalog."""
+    
+    def __init__(self, card_repo: CardRepository):
+        self.card_repo = card_repo
+    
+    def execute(self) -> Iterator[Card]:
+        """
+        Iterate over every card.
+        
+        Returns:
+            Iterator of Card entities, ordered by code
+        """
+        return self.card_repo.iter_all()
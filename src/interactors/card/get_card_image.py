@@ -1,6 +1,5 @@
 """Interactor to get a card image."""
-from typing import Optional
-from PIL import Image
+from typing import BinaryIO, Optional, Tuple
 from src.boundaries.marvelcdb_gateway import MarvelCDBGateway
 from src.boundaries.image_storage import ImageStorage
 
@@ -16,23 +15,28 @@ class GetCardImageInteractor:
         self.marvelcdb = marvelcdb_gateway
         self.image_storage = image_storage
     
-    def execute(self, card_code: str) -> Optional[Image.Image]:
+    def execute(self, card_code: str) -> Optional[Tuple[BinaryIO, str]]:
         """
         Get card image, downloading if not cached.
         
+        The stored file is streamed as-is; it is only decoded when a new
+        image has to be downloaded and saved.
+        
         Args:
             card_code: Card identifier
             
         Returns:
-            Image object or None if not found
+            (open image stream, mimetype) or None if not found
         """
-        if self.image_storage.image_exists(card_code):
-            return self.image_storage.get_image(card_code)
+        stored = self.image_storage.open_image_stream(card_code)
+        if stored is not None:
+            return stored
         
         try:
             image = self.marvelcdb.get_card_image(card_code)
-            if image:
-                self.image_storage.save_image(card_code, image)
-            return image
+            if image is None:
+                return None
+            self.image_storage.save_image(card_code, image)
+            return self.image_storage.open_image_stream(card_code)
         except Exception:
             return None
@@ -10,14 +10,16 @@ class SearchCardsInteractor:
     def __init__(self, card_repo: CardRepository):
         self.card_repo = card_repo
     
-    def execute(self, name: str) -> List[Card]:
+    def execute(self, name: str, limit: int = 50, offset: int = 0) -> List[Card]:
         """
         Search cards by name.
         
         Args:
             name: Name or partial name to search for
+            limit: Maximum number of cards to return
+            offset: Number of matching cards to skip
             
         Returns:
-            List of matching Card entities
+            List of matching Card entities, ordered by code
         """
-        return self.card_repo.search_by_name(name)
+        return self.card_repo.search_by_name(name, limit=limit, offset=offset)
@@ -92,14 +92,7 @@ class CardInteractor:
             return existing
         
         # Fetch from MarvelCDB
-        card_data = self.marvelcdb.get_card_info(card_code)
-        
-        # Create entity
-        card = Card(
-            code=card_data['code'],
-            name=card_data['name'],
-            text=card_data.get('text')
-        )
+        card = self._fetch_card(card_code)
         
         # Save to repository
         saved_card = self.card_repo.save(card)
@@ -132,27 +125,28 @@ class CardInteractor:
             >>> cards = interactor.import_cards_bulk(codes)
             >>> assert len(cards) <= len(codes)
         """
-        # Filter out cards we already have
-        existing_codes = set()
-        for code in card_codes:
-            if self.card_repo.exists(code):
-                existing_codes.add(code)
+        # Filter out cards we already have, in one lookup
+        missing_codes = self.card_repo.find_missing_codes(card_codes)
         
-        codes_to_import = [c for c in card_codes if c not in existing_codes]
+        codes_to_import = [c for c in card_codes if c in missing_codes]
         
         if not codes_to_import:
             # All cards already exist
             return self.card_repo.find_by_codes(card_codes)
         
-        # Import new cards
+        # Fetch new cards
         new_cards = []
         for code in codes_to_import:
             try:
-                card = self.import_card_from_marvelcdb(code)
-                new_cards.append(card)
+                new_cards.append(self._fetch_card(code))
             except Exception as e:
                 print(f"Failed to import card {code}: {e}")
         
+        # Save them in one batch, then fetch their images
+        self.card_repo.save_all(new_cards)
+        for card in new_cards:
+            self._download_card_image(card.code)
+        
         # Return all cards (existing + new)
         return self.card_repo.find_by_codes(card_codes)
     
@@ -239,6 +233,23 @@ class CardInteractor:
         except Exception:
             return None
     
+    def _fetch_card(self, card_code: str) -> Card:
+        """
+        Internal helper to build a Card entity from MarvelCDB data.
+        
+        Args:
+            card_code: Card to fetch
+            
+        Returns:
+            Card entity (not yet saved)
+        """
+        card_data = self.marvelcdb.get_card_info(card_code)
+        return Card(
+            code=card_data['code'],
+            name=card_data['name'],
+            text=card_data.get('text')
+        )
+    
     def _download_card_image(self, card_code: str):
         """
         Internal helper to download and cache a card's image.
@@ -1,6 +1,6 @@
 """Interactor to list all decks."""
 from typing import List
-from src.entities import Deck
+from src.entities import DeckSummary
 from src.boundaries.deck_repository import DeckRepository
 
 
@@ -10,11 +10,11 @@ class ListDecksInteractor:
     def __init__(self, deck_repo: DeckRepository):
         self.deck_repo = deck_repo
     
-    def execute(self) -> List[Deck]:
+    def execute(self) -> List[DeckSummary]:
         """
         Get all decks.
         
         Returns:
-            List of all Deck entities
+            List of DeckSummary entities, most recently updated first
         """
-        return self.deck_repo.find_all()
+        return self.deck_repo.find_all(summary=True)
@@ -39,10 +39,11 @@ class CreateGameInteractor:
         if len(deck_ids) != len(player_names):
             raise ValueError("Number of decks must match number of players")
         
-        # Load decks and shuffle them
+        # Load every deck in one query, then shuffle them
+        decks = {deck.id: deck for deck in self.deck_repo.find_by_ids(deck_ids)}
         players = []
         for deck_id, player_name in zip(deck_ids, player_names):
-            deck = self.deck_repo.find_by_id(deck_id)
+            deck = decks.get(deck_id)
             if not deck:
                 raise ValueError(f"Deck {deck_id} not found")
             
@@ -1,6 +1,6 @@
 """Interactor to list all games."""
 from typing import List
-from src.entities import Game
+from src.entities import GameSummary
 from src.boundaries.game_repository import GameRepository
 
 
@@ -10,11 +10,11 @@ class ListGamesInteractor:
     def __init__(self, game_repo: GameRepository):
         self.game_repo = game_repo
     
-    def execute(self) -> List[Game]:
+    def execute(self) -> List[GameSummary]:
         """
         Get all games.
         
         Returns:
-            List of all Game entities
+            List of GameSummary entries, most recently updated first
         """
-        return self.game_repo.find_all()
+        return self.game_repo.find_all(summary=True)
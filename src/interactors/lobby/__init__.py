@@ -11,6 +11,7 @@ from .delete_lobby import DeleteLobbyInteractor
 from .save_encounter import SaveEncounterDeckInteractor
 from .list_encounters import ListSavedEncounterDecksInteractor
 from .get_encounter import LoadSavedEncounterDeckInteractor
+from .watch_lobbies import WatchLobbiesInteractor
 
 __all__ = [
     'CreateLobbyInteractor',
@@ -25,5 +26,6 @@ __all__ = [
     'DeleteLobbyInteractor',
     'SaveEncounterDeckInteractor',
     'ListSavedEncounterDecksInteractor',
-    'LoadSavedEncounterDeckInteractor'
+    'LoadSavedEncounterDeckInteractor',
+    'WatchLobbiesInteractor'
 ]
@@ -29,11 +29,8 @@ class LoadSavedEncounterDeckInteractor:
         
         name = name.strip()
         
-        # Get all encounter decks
-        all_decks = self.deck_repo.find_all()
-        
-        # Find the deck with this name in saved_names
-        for deck in all_decks:
+        # Find the deck with this name in saved_names, stopping at the first match
+        for deck in self.deck_repo.iter_all():
             if isinstance(deck, EncounterDeck) and name in deck.saved_names:
                 # Extract module names from source_url
                 if deck.source_url and deck.source_url.startswith("modules:"):
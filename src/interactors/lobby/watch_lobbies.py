@@ -0,0 +1,43 @@
+"""Interactor to watch lobby changes."""
+from typing import Iterator, Optional, Tuple
+from src.entities import Game, GamePhase
+from src.boundaries.game_repository import GameRepository
+
+
+class LobbyChanges:
+    """Lobby upserts and deletes from a game change stream; close() stops watching"""
+    
+    def __init__(self, changes):
+        self._changes = changes
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, Optional[Game]]]:
+        for operation, game_id, game in self._changes:
+            if operation != 'delete' and game and game.phase == GamePhase.LOBBY:
+                yield 'upsert', str(game_id), game
+            elif operation != 'insert':
+                # Deleted, or its phase moved on from the lobby
+                yield 'delete', str(game_id), None
+    
+    def close(self) -> None:
+        self._changes.close()
+
+
+class WatchLobbiesInteractor:
+    """Stream lobby changes instead of re-listing every lobby."""
+    
+    def __init__(self, game_repo: GameRepository):
+        self.game_repo = game_repo
+    
+    def execute(self) -> LobbyChanges:
+        """
+        Watch for lobby changes.
+        
+        Watching starts when this is called; iterating the result then
+        blocks for each change, and closing it stops watching.
+        
+        Yields:
+            ('upsert', lobby_id, game) when a lobby is created or changed,
+            ('delete', lobby_id, None) when a lobby is deleted or leaves
+            the LOBBY phase
+        """
+        return LobbyChanges(self.game_repo.watch())
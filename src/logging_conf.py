@@ -9,10 +9,12 @@ Provides:
 
 from pathlib import Path
 from typing import Optional
+import atexit
 import logging
 import logging.handlers
 import datetime
 import json
+import queue
 
 
 # Create logs directory
@@ -20,11 +22,51 @@ LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that doesn't flush after every record.
+    
+    Records collect in the file's write buffer until flush_buffer() is
+    called (or the buffer fills, or the file is rotated or closed).
+    """
+    
+    def flush(self):
+        """Called by emit() after each record; deferred to flush_buffer()"""
+    
+    def flush_buffer(self):
+        """Write out the buffered records"""
+        super().flush()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers only when the queue runs dry.
+    
+    A burst of records goes out in a few buffered writes rather than one
+    write per record; a lone record is still written as soon as it's handled.
+    """
+    
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush_buffer()
+        return self.queue.get(block)
+    
+    def stop(self):
+        """Drain the queue, then write out what the handlers still buffer"""
+        super().stop()
+        for handler in self.handlers:
+            handler.flush_buffer()
+
+
 class AuditLogger:
     """
     Audit logger for tracking user actions.
     
-    Logs to separate audit log file with structured format.
+    Logs to separate audit log file with structured format. Requests only
+    enqueue their record; a background thread formats and writes it, so
+    the file write is off the request path, and batches the writes of
+    records that arrive together.
     """
     
     def __init__(self):
@@ -33,7 +75,7 @@ class AuditLogger:
         self.logger.propagate = False  # Don't propagate to root logger
         
         # Audit log file with rotation
-        audit_handler = logging.handlers.RotatingFileHandler(
+        audit_handler = BufferedRotatingFileHandler(
             LOGS_DIR / "audit.log",
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=10
@@ -41,7 +83,13 @@ class AuditLogger:
         
         # JSON formatter for structured logs
         audit_handler.setFormatter(JsonFormatter())
-        self.logger.addHandler(audit_handler)
+        
+        audit_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(audit_queue))
+        self._listener = BatchingQueueListener(audit_queue, audit_handler)
+        self._listener.start()
+        # Stopping drains the queue, so no record is lost at shutdown
+        atexit.register(self._listener.stop)
     
     def log_action(
         self,
@@ -82,7 +130,8 @@ class JsonFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            # When the record was created, not when it was written out
+            "timestamp": datetime.datetime.fromtimestamp(record.created, datetime.UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -1,3 +1,5 @@
 from .audit_middleware import audit_endpoint, setup_request_logging, get_user_id
+from .cors import setup_cors
+from .compression import setup_compression
 
-__all__ = ['audit_endpoint', 'setup_request_logging', 'get_user_id']
+__all__ = ['audit_endpoint', 'setup_request_logging', 'get_user_id', 'setup_cors', 'setup_compression']
@@ -11,6 +11,10 @@ from src.logging_conf import audit_logger
 
 logger = logging.getLogger(__name__)
 
+# Methods whose JSON body is recorded, and body keys never recorded
+_BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+_SENSITIVE_KEYS = frozenset({'password', 'token', 'secret', 'cookie'})
+
 
 def get_user_id() -> str:
     """
@@ -54,8 +58,8 @@ def audit_endpoint(action: str):
             
             # Log the request
             logger.debug(
-                f"User {user_id} calling {request.endpoint} "
-                f"({request.method} {request.path})"
+                "User %s calling %s (%s %s)",
+                user_id, request.endpoint, request.method, request.path
             )
             
             # Call the actual endpoint
@@ -74,7 +78,7 @@ def audit_endpoint(action: str):
             }
             
             # Add body for POST/PUT (be careful with sensitive data!)
-            if request.method in ['POST', 'PUT', 'PATCH']:
+            if request.method in _BODY_METHODS:
                 if request.is_json:
                     # Don't log sensitive fields
                     body = request.get_json()
@@ -82,7 +86,7 @@ def audit_endpoint(action: str):
                         # Filter out sensitive keys
                         filtered_body = {
                             k: v for k, v in body.items() 
-                            if k not in ['password', 'token', 'secret', 'cookie']
+                            if k not in _SENSITIVE_KEYS
                         }
                         details["body"] = filtered_body
             
@@ -97,8 +101,8 @@ def audit_endpoint(action: str):
             )
             
             logger.info(
-                f"Action '{action}' completed for user {user_id} "
-                f"(status: {status_code})"
+                "Action '%s' completed for user %s (status: %s)",
+                action, user_id, status_code
             )
             
             return response
@@ -115,9 +119,9 @@ def setup_request_logging(app):
     """
     @app.before_request
     def log_request():
-        logger.debug(f">> {request.method} {request.path}")
+        logger.debug(">> %s %s", request.method, request.path)
     
     @app.after_request
     def log_response(response):
-        logger.debug(f"<< {response.status_code} {request.path}")
+        logger.debug("<< %s %s", response.status_code, request.path)
         return response
@@ -0,0 +1,52 @@
+"""
+Gzip compression for JSON responses.
+
+Deck and game listings can run to hundreds of KB of JSON; gzipped they
+shrink to a small fraction of that. Small bodies are sent as-is, since
+compressing them costs more than it saves.
+"""
+
+import gzip
+
+from flask import Flask, request
+
+_COMPRESSED_MIMETYPES = frozenset({'application/json'})
+
+
+def setup_compression(app: Flask, min_size: int = 1024, level: int = 4):
+    """
+    Gzip JSON responses for clients that accept it.
+
+    Streamed and file responses (the NDJSON export, card images) are left
+    alone: they are not buffered, and images are already compressed.
+
+    Args:
+        app: Flask application
+        min_size: Smallest body, in bytes, worth compressing
+        level: gzip compression level (1 fastest - 9 smallest)
+    """
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or response.mimetype not in _COMPRESSED_MIMETYPES
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if 'gzip' not in request.accept_encodings:
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=level))
+        response.headers['Content-Encoding'] = 'gzip'
+        # A strong ETag names exact bytes; the gzipped body only matches
+        # the uncompressed one semantically
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,37 @@
+"""
+CORS headers for the JSON API.
+
+The allowed origin, methods and headers are fixed for the life of the
+app, so the header list is built once and appended to every response.
+"""
+
+from flask import Flask
+
+_ALLOWED_METHODS = 'GET,POST,PUT,DELETE,OPTIONS'
+_ALLOWED_HEADERS = 'Content-Type,Authorization'
+
+
+def setup_cors(app: Flask, origin: str = '*'):
+    """
+    Add CORS headers to every response from app.
+
+    Preflight requests need no route of their own: Flask answers OPTIONS
+    for every route automatically, and that response gets the headers too.
+
+    Args:
+        app: Flask application
+        origin: Value of Access-Control-Allow-Origin
+    """
+    cors_headers = [
+        ('Access-Control-Allow-Origin', origin),
+        ('Access-Control-Allow-Methods', _ALLOWED_METHODS),
+        ('Access-Control-Allow-Headers', _ALLOWED_HEADERS),
+    ]
+    if origin != '*':
+        # Caches must not serve one origin's response to another
+        cors_headers.append(('Vary', 'Origin'))
+
+    @app.after_request
+    def add_cors_headers(response):
+        response.headers.extend(cors_headers)
+        return response
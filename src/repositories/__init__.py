@@ -1,9 +1,14 @@
 from .mongo_card_repository import MongoCardRepository
 from .mongo_deck_repository import MongoDeckRepository
 from .mongo_game_repository import MongoGameRepository
+from .coalescing_repository import CoalescingRepository, CoalescingCardRepository
+from .cached_card_repository import CachedCardRepository
 
 __all__ = [
     'MongoCardRepository',
     'MongoDeckRepository',
-    'MongoGameRepository'
+    'MongoGameRepository',
+    'CoalescingRepository',
+    'CoalescingCardRepository',
+    'CachedCardRepository'
 ]
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+In-memory card catalog in front of a CardRepository.
+
+The card catalog is a few thousand small, rarely changing documents, so
+the whole set is loaded once and lookups are answered from a dict instead
+of a MongoDB round-trip per call.
+"""
+
+from typing import Dict, Iterator, List, Optional, Set
+import threading
+
+from src.boundaries import CardRepository
+from src.entities import Card
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Every three-character slice of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CachedCardRepository(CardRepository):
+    """
+    CardRepository that serves reads from an in-memory index.
+
+    The full card set is loaded on the first read. Writes go to the wrapped
+    repository and are merged into the index. A code missing from the index
+    is still looked up in the wrapped repository (another process may have
+    imported it), and merged in if found.
+
+    Example:
+        >>> card_repo = CachedCardRepository(MongoCardRepository(db))
+        >>> card_repo.find_by_code('01001a')  # loads the catalog once
+    """
+
+    def __init__(self, inner: CardRepository):
+        self._inner = inner
+        self._by_code: Optional[Dict[str, Card]] = None
+        # Trigram of a lowercased name -> codes of the cards containing it
+        self._name_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _catalog(self) -> Dict[str, Card]:
+        """The code -> card index, loading it on first use"""
+        if self._by_code is None:
+            with self._lock:
+                if self._by_code is None:
+                    by_code = {}
+                    name_index = {}
+                    for card in self._inner.find_all(limit=0):
+                        by_code[card.code] = card
+                        for trigram in _trigrams(card.name.lower()):
+                            name_index.setdefault(trigram, set()).add(card.code)
+                    self._name_index = name_index
+                    self._by_code = by_code
+        return self._by_code
+
+    def _merge(self, cards: List[Card]) -> None:
+        """Add written or newly found cards to a loaded index"""
+        if self._by_code is None:
+            return
+        with self._lock:
+            for card in cards:
+                self._by_code[card.code] = card
+                # Replace rather than mutate, so a concurrent search never
+                # iterates a set that is changing size
+                for trigram in _trigrams(card.name.lower()):
+                    self._name_index[trigram] = self._name_index.get(trigram, set()) | {card.code}
+
+    def find_by_code(self, code: str) -> Optional[Card]:
+        """Find a card by its unique code"""
+        card = self._catalog().get(code)
+        if card is None:
+            card = self._inner.find_by_code(code)
+            if card is not None:
+                self._merge([card])
+        return card
+
+    def find_by_codes(self, codes: List[str]) -> List[Card]:
+        """Find multiple cards by their codes"""
+        catalog = self._catalog()
+        found = [catalog[code] for code in codes if code in catalog]
+        missing = [code for code in codes if code not in catalog]
+        if missing:
+            fetched = self._inner.find_by_codes(missing)
+            self._merge(fetched)
+            found.extend(fetched)
+        return found
+
+    def find_missing_codes(self, codes: List[str]) -> Set[str]:
+        """Get the codes that have no stored card"""
+        catalog = self._catalog()
+        missing = [code for code in codes if code not in catalog]
+        if not missing:
+            return set()
+        # Cards another process imported are only found by asking
+        return self._inner.find_missing_codes(missing)
+
+    def save(self, card: Card) -> Card:
+        """Save a card and return the saved entity"""
+        saved = self._inner.save(card)
+        self._merge([saved])
+        return saved
+
+    def save_all(self, cards: List[Card]) -> List[Card]:
+        """Save multiple cards"""
+        saved = self._inner.save_all(cards)
+        self._merge(saved)
+        return saved
+
+    def exists(self, code: str) -> bool:
+        """Check if a card exists"""
+        return self.find_by_code(code) is not None
+
+    def find_all(self, limit: int = 100, offset: int = 0) -> List[Card]:
+        """Find all cards with pagination"""
+        return self._inner.find_all(limit, offset)
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Card]:
+        """Iterate over every card, ordered by code"""
+        return self._inner.iter_all(batch_size)
+
+    def search_by_name(self, name: str, limit: int = 50, offset: int = 0) -> List[Card]:
+        """
+        Search cards by name (case-insensitive substring match), one page
+        at a time, ordered by code.
+
+        Unlike the MongoDB repository, name is matched literally rather
+        than as a regular expression.
+        """
+        catalog = self._catalog()
+        query = name.lower()
+        if len(query) >= 3:
+            # Only names containing every trigram of the query can match
+            trigram_sets = [self._name_index.get(t, set()) for t in _trigrams(query)]
+            candidates = set.intersection(*trigram_sets)
+        else:
+            candidates = list(catalog)
+        matches = sorted(
+            code for code in candidates if query in catalog[code].name.lower()
+        )
+        return [catalog[code] for code in matches[offset:offset + limit]]
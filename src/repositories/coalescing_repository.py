@@ -0,0 +1,102 @@
+"""
+Request-coalescing proxy for repositories.
+
+Concurrent identical reads (e.g. many GET /api/cards/01001 at once) share
+a single in-flight query instead of each hitting MongoDB.
+"""
+
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Dict, Iterable
+import threading
+
+from src.boundaries import CardRepository
+
+
+class CoalescingRepository:
+    """
+    Wraps a repository so concurrent calls to the same read method with the
+    same arguments run one query and all receive its result. List results
+    are copied per caller, so one request sorting or filtering its list
+    in place can't change another's.
+
+    Write methods clear the in-flight table before and after running, so a
+    read issued after a write never joins a query that started before the
+    write finished.
+
+    Example:
+        >>> card_repo = CoalescingRepository(
+        ...     MongoCardRepository(db),
+        ...     read_methods=('find_by_code', 'exists'),
+        ...     write_methods=('save', 'save_all')
+        ... )
+    """
+
+    def __init__(self, inner, read_methods: Iterable[str], write_methods: Iterable[str]):
+        self._inner = inner
+        self._read_methods = frozenset(read_methods)
+        self._write_methods = frozenset(write_methods)
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if name in self._read_methods:
+            return partial(self._read, name, attr)
+        if name in self._write_methods:
+            return partial(self._write, attr)
+        return attr
+
+    def _read(self, name, method, *args, **kwargs):
+        """Run a read, or wait for the identical one already in flight"""
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (e.g. lists) can't be matched up
+            return method(*args, **kwargs)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            return self._own_copy(future.result())
+
+        try:
+            future.set_result(method(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+        return self._own_copy(future.result())
+
+    @staticmethod
+    def _own_copy(result):
+        """A shared list result, copied for one caller"""
+        return list(result) if isinstance(result, list) else result
+
+    def _write(self, method, *args, **kwargs):
+        """Run a write; later reads start a fresh query"""
+        with self._lock:
+            self._inflight.clear()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            # Reads that started during the write may have seen old data
+            with self._lock:
+                self._inflight.clear()
+
+
+@CardRepository.register
+class CoalescingCardRepository(CoalescingRepository):
+    """
+    CoalescingRepository over a CardRepository.
+
+    Registered as a CardRepository, so it can stand in wherever one is
+    expected; every method is still forwarded to the wrapped repository.
+    """
@@ -0,0 +1,46 @@
+"""
+Indexes created on first use rather than when a repository is built.
+
+A worker that never serves a given query never pays for its index's
+create_index round-trip (or build, on a fresh database).
+"""
+
+from typing import Any, Dict, Tuple
+import threading
+
+from pymongo.collection import Collection
+
+
+class LazyIndexes:
+    """
+    A collection's indexes, each created the first time it is ensured.
+
+    Example:
+        >>> indexes = LazyIndexes(collection, {
+        ...     'code': ('code', {'unique': True}),
+        ...     'name': ('name', {})
+        ... })
+        >>> indexes.ensure('code')  # create_index runs once
+    """
+
+    def __init__(self, collection: Collection, specs: Dict[str, Tuple[Any, Dict[str, Any]]]):
+        """
+        Args:
+            collection: Collection the indexes belong to
+            specs: Index label -> (keys, create_index options)
+        """
+        self._collection = collection
+        self._specs = specs
+        self._ensured = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, *labels: str) -> None:
+        """Create the labelled indexes that haven't been created yet"""
+        if self._ensured.issuperset(labels):
+            return
+        with self._lock:
+            for label in labels:
+                if label not in self._ensured:
+                    keys, options = self._specs[label]
+                    self._collection.create_index(keys, **options)
+                    self._ensured.add(label)
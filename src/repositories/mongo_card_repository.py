@@ -1,11 +1,14 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator, Set
 from pymongo.database import Database
 from pymongo import UpdateOne
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from src.boundaries import CardRepository
 from src.entities import Card
 import datetime
 
 from .serializers import CardSerializer
+from .indexes import LazyIndexes
 
 class MongoCardRepository(CardRepository):
     """MongoDB implementation of CardRepository"""
@@ -14,24 +17,51 @@ class MongoCardRepository(CardRepository):
         if 'cards' not in db.list_collection_names():
             db.create_collection('cards', capped=False)
         self.collection = db['cards']
-        self.collection.create_index('code', unique=True)
-        self.collection.create_index('name')
+        self._indexes = LazyIndexes(self.collection, {
+            'code': ('code', {'unique': True}),
+            'name': ('name', {})
+        })
+        # Undecoded view for lookups that never need the card's fields
+        self._raw_collection = db.get_collection(
+            'cards',
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+    
+    def find_all(self, limit: int = 100, offset: int = 0) -> List[Card]:
+        """Find all cards with pagination (limit=0 returns every card)"""
+        self._indexes.ensure('code')
+        docs = self.collection.find().sort('code', 1).skip(offset).limit(limit)
+        return [CardSerializer.to_entity(doc) for doc in docs]
     
-    def find_all(self, limit = 100, offset = 0):
-        return super().find_all(limit, offset)
+    def iter_all(self, batch_size: int = 500) -> Iterator[Card]:
+        """Iterate over every card, ordered by code"""
+        self._indexes.ensure('code')
+        docs = self.collection.find().sort('code', 1).batch_size(batch_size)
+        for doc in docs:
+            yield CardSerializer.to_entity(doc)
     
     def find_by_code(self, code: str) -> Optional[Card]:
         """Find a card by its unique code"""
+        self._indexes.ensure('code')
         doc = self.collection.find_one({'code': code})
         return CardSerializer.to_entity(doc) if doc else None
     
     def find_by_codes(self, codes: List[str]) -> List[Card]:
         """Find multiple cards by their codes"""
+        self._indexes.ensure('code')
         docs = self.collection.find({'code': {'$in': codes}})
         return [CardSerializer.to_entity(doc) for doc in docs]
     
+    def find_missing_codes(self, codes: List[str]) -> Set[str]:
+        """Get the codes that have no stored card, in a single lookup"""
+        self._indexes.ensure('code')
+        # Only the codes come back; the index alone can answer this
+        docs = self.collection.find({'code': {'$in': codes}}, {'_id': 0, 'code': 1})
+        return set(codes) - {doc['code'] for doc in docs}
+    
     def save(self, card: Card) -> Optional[Card]:
         """Save a card and return the saved entity"""
+        self._indexes.ensure('code')
         doc = CardSerializer.to_doc(card)
         doc['updated_at'] = datetime.datetime.now(datetime.UTC)
         
@@ -41,17 +71,22 @@ class MongoCardRepository(CardRepository):
             upsert=True
         )
 
-        return self.find_by_code(card.code)
+        # The document we just wrote is the saved state - skip the re-read
+        return CardSerializer.to_entity(doc)
     
     def save_all(self, cards: List[Card]) -> List[Card]:
         """Save multiple cards"""
         if not cards:
             return []
+        self._indexes.ensure('code')
         
+        now = datetime.datetime.now(datetime.UTC)
+        docs = []
         operations = []
         for card in cards:
             doc = CardSerializer.to_doc(card)
-            doc['updated_at'] = datetime.datetime.now(datetime.UTC)
+            doc['updated_at'] = now
+            docs.append(doc)
             operations.append(
                 UpdateOne(
                     filter={'code': card.code},
@@ -59,18 +94,22 @@ class MongoCardRepository(CardRepository):
                     upsert=True)
             )
         
-        if operations:
-            self.collection.bulk_write(operations)
+        # Unordered lets the server apply the upserts without serializing them
+        self.collection.bulk_write(operations, ordered=False)
         
-        return self.find_by_codes([card.code for card in cards])
+        # Everything written is already in memory - no need to read it back
+        return [CardSerializer.to_entity(doc) for doc in docs]
     
     def exists(self, code: str) -> bool:
         """Check if a card exists"""
-        return self.collection.count_documents({'code': code}) > 0
+        self._indexes.ensure('code')
+        doc = self._raw_collection.find_one({'code': code}, {'_id': 1})
+        return doc is not None
     
-    def search_by_name(self, name: str) -> List[Card]:
-        """Search cards by name (partial match)"""
+    def search_by_name(self, name: str, limit: int = 50, offset: int = 0) -> List[Card]:
+        """Search cards by name (partial match), one page at a time, ordered by code"""
+        self._indexes.ensure('name')
         docs = self.collection.find({
             'name': {'$regex': name, '$options': 'i'}
-        }).limit(50)
+        }).sort('code').skip(offset).limit(limit)
         return [CardSerializer.to_entity(doc) for doc in docs]
\ No newline at end of file
@@ -1,62 +1,214 @@
-from typing import Optional, List
+from typing import Optional, List, Union, Iterator
+import threading
+from cachetools import TTLCache
 from pymongo.database import Database
+from pymongo import UpdateOne
 from src.boundaries import DeckRepository
-from src.entities import DeckList, DeckCard
+from src.entities import DeckList, DeckCard, DeckSummary
 import datetime
 
 from src.entities.deck import DeckList
 
-from .serializers import DeckListSerializer
+from .serializers import DeckListSerializer, DeckSummarySerializer
+from .indexes import LazyIndexes
 
 class MongoDeckRepository(DeckRepository):
     """MongoDB implementation of DeckRepository"""
     
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, cache_ttl: float = 30, list_cache_ttl: float = 5):
         if 'decks' not in db.list_collection_names():
             db.create_collection('decks', capped=False)
         self.decks_collection = db['decks']
-        self.decks_collection.create_index('deck_id')
-        self.decks_collection.create_index('name')
+        self._indexes = LazyIndexes(self.decks_collection, {
+            'deck_id': ('deck_id', {}),
+            # Serves the module / player-deck listings, already in name order
+            'module_name': ([('is_module', 1), ('name', -1)], {'name': 'module_name'}),
+            'updated_at': ([('updated_at', -1)], {})
+        })
+        # Read-through caches, invalidated on writes. The TTLs bound how
+        # stale a read can be when another process writes the same decks.
+        # TTLCache isn't thread-safe and request and deck-save threads
+        # share these, so every access holds _cache_lock.
+        self._cache = TTLCache(maxsize=512, ttl=cache_ttl)
+        self._list_cache = TTLCache(maxsize=4, ttl=list_cache_ttl)
+        self._cache_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every cached deck and deck listing"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._list_cache.clear()
+
+    def _evict(self, deck_ids: List[str]) -> None:
+        """Drop the given decks and every listing from the caches"""
+        with self._cache_lock:
+            for deck_id in deck_ids:
+                self._cache.pop(deck_id, None)
+            self._list_cache.clear()
+
+    @staticmethod
+    def _is_valid_id(deck_id: str) -> bool:
+        """Deck ids are non-empty strings; anything else can't match"""
+        return isinstance(deck_id, str) and bool(deck_id)
 
     def find_by_id(self, deck_id: str) -> Optional[DeckList]:
         """Find a deck by its ID"""
-        try:
-            doc = self.decks_collection.find_one({'deck_id': deck_id})
-            return DeckListSerializer.to_entity(doc) if doc else None
-        except Exception:
+        if not self._is_valid_id(deck_id):
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(deck_id)
+        if cached is not None:
+            return cached
+        self._indexes.ensure('deck_id')
+        doc = self.decks_collection.find_one({'deck_id': deck_id})
+        if not doc:
             return None
+        deck_list = DeckListSerializer.to_entity(doc)
+        with self._cache_lock:
+            self._cache[deck_id] = deck_list
+        return deck_list
+    
+    def find_by_ids(self, deck_ids: List[str]) -> List[DeckList]:
+        """Find several decks in one query, in the order of deck_ids"""
+        found = {}
+        missing = []
+        with self._cache_lock:
+            for deck_id in deck_ids:
+                if not self._is_valid_id(deck_id):
+                    continue
+                cached = self._cache.get(deck_id)
+                if cached is not None:
+                    found[deck_id] = cached
+                else:
+                    missing.append(deck_id)
+        
+        if missing:
+            self._indexes.ensure('deck_id')
+            fetched = {}
+            for doc in self.decks_collection.find({'deck_id': {'$in': missing}}):
+                deck_list = DeckListSerializer.to_entity(doc)
+                fetched[deck_list.id] = deck_list
+            with self._cache_lock:
+                self._cache.update(fetched)
+            found.update(fetched)
+        
+        return [found[deck_id] for deck_id in deck_ids if deck_id in found]
     
     def save(self, deck_list: DeckList) -> Optional[DeckList]:
         """Save a deck list and return the saved entity"""
         doc = DeckListSerializer.to_doc(deck_list)
         doc['updated_at'] = datetime.datetime.now(datetime.UTC)
         
-        self.decks_collection.update_one(
-            {'deck_id': deck_list.id},
-            {'$set': doc},
-            True
-        )
-        return self.find_by_id(deck_list.id)
+        self._indexes.ensure('deck_id')
+        # Evict again once written: a read racing the write may have
+        # re-cached the old document
+        self._evict([deck_list.id])
+        try:
+            self.decks_collection.update_one(
+                {'deck_id': deck_list.id},
+                {'$set': doc},
+                True
+            )
+        finally:
+            self._evict([deck_list.id])
+        # The document we just wrote is the saved state - skip the re-read
+        return DeckListSerializer.to_entity(doc)
+
+    def save_many(self, deck_lists: List[DeckList]) -> List[DeckList]:
+        """Save several deck lists in a single bulk write"""
+        if not deck_lists:
+            return []
+        self._indexes.ensure('deck_id')
+        
+        now = datetime.datetime.now(datetime.UTC)
+        docs = []
+        operations = []
+        for deck_list in deck_lists:
+            doc = DeckListSerializer.to_doc(deck_list)
+            doc['updated_at'] = now
+            docs.append(doc)
+            operations.append(
+                UpdateOne(
+                    filter={'deck_id': deck_list.id},
+                    update={'$set': doc},
+                    upsert=True)
+            )
+        
+        deck_ids = [deck_list.id for deck_list in deck_lists]
+        self._evict(deck_ids)
+        try:
+            self.decks_collection.bulk_write(operations, ordered=False)
+        finally:
+            self._evict(deck_ids)
+        
+        # Everything written is already in memory - no need to read it back
+        return [DeckListSerializer.to_entity(doc) for doc in docs]
 
     def delete(self, deck_id: str) -> bool:
         """Delete a deck by ID"""
+        if not self._is_valid_id(deck_id):
+            return False
+        self._indexes.ensure('deck_id')
+        self._evict([deck_id])
         try:
             result = self.decks_collection.delete_one({'deck_id': deck_id})
-            return result.deleted_count > 0
-        except Exception:
-            return False
+        finally:
+            self._evict([deck_id])
+        return result.deleted_count > 0
     
-    def find_all(self) -> List[DeckList]:
-        """Find all decks"""
-        docs = self.decks_collection.find().sort('updated_at', -1)
-        return [DeckListSerializer.to_entity(doc) for doc in docs]
+    def find_all(self, summary: bool = False,
+                 limit: Optional[int] = None) -> List[Union[DeckList, DeckSummary]]:
+        """Find all decks, most recently updated first"""
+        key = (summary, limit)
+        with self._cache_lock:
+            cached = self._list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        if summary:
+            decks = self._find_all_summaries(limit)
+        else:
+            decks = list(self.iter_all(limit))
+        with self._cache_lock:
+            if not summary:
+                self._cache.update((deck_list.id, deck_list) for deck_list in decks)
+            self._list_cache[key] = decks
+        return list(decks)
+
+    def iter_all(self, limit: Optional[int] = None,
+                 batch_size: int = 500) -> Iterator[DeckList]:
+        """Iterate over all decks, most recently updated first"""
+        self._indexes.ensure('updated_at')
+        docs = self.decks_collection.find().sort('updated_at', -1).batch_size(batch_size)
+        if limit:
+            docs = docs.limit(limit)
+        for doc in docs:
+            yield DeckListSerializer.to_entity(doc)
+
+    def _find_all_summaries(self, limit: Optional[int]) -> List[DeckSummary]:
+        """Find all decks as summaries, counting cards server-side"""
+        self._indexes.ensure('updated_at')
+        pipeline = [{'$sort': {'updated_at': -1}}]
+        if limit:
+            pipeline.append({'$limit': limit})
+        # Only the totals leave the server, not the cards arrays
+        pipeline.append({'$project': {
+            '_id': 0,
+            'deck_id': 1,
+            'name': 1,
+            'total_quantity': {'$sum': '$cards.quantity'}
+        }})
+        docs = self.decks_collection.aggregate(pipeline)
+        return [DeckSummarySerializer.to_entity(doc) for doc in docs]
     
     def find_all_modules(self) -> List[DeckList]:
         """Find all encounter modules"""
+        self._indexes.ensure('module_name')
         docs = self.decks_collection.find({'is_module': True}).sort('name', -1)
         return [DeckListSerializer.to_entity(doc) for doc in docs]
     
     def find_all_player_decks(self) -> List[DeckList]:
         """Find all player decks"""
+        self._indexes.ensure('module_name')
         docs = self.decks_collection.find({'is_module': False}).sort('name', -1)
         return [DeckListSerializer.to_entity(doc) for doc in docs]
\ No newline at end of file
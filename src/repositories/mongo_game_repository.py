@@ -1,14 +1,52 @@
 """
 MongoDB implementation of GameRepository
 """
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple, Union
 import uuid
 from pymongo.database import Database
+from pymongo import UpdateOne
 from src.boundaries.game_repository import GameRepository
-from src.entities import Game
+from src.entities import Game, GamePhase, GameSummary
 import datetime
 
-from .serializers import GameSerializer
+from .serializers import GameSerializer, GameSummarySerializer
+from .indexes import LazyIndexes
+
+_SUMMARY_FIELDS = {'name': 1, 'host': 1, 'phase': 1, 'updated_at': 1}
+
+# Change-stream filter for watch(): writes to lobbies, the update that
+# moves a game out of the lobby, and deletes. Moves, draws and plays in a
+# running game never leave the server.
+_LOBBY_CHANGES = {'$match': {'$or': [
+    {'operationType': 'delete'},
+    {'operationType': {'$in': ['insert', 'update', 'replace']},
+     'fullDocument.phase': GamePhase.LOBBY.value},
+    {'operationType': 'update',
+     'updateDescription.updatedFields.phase': {'$exists': True}},
+]}}
+
+
+class _GameChanges:
+    """
+    An open change stream, iterated as (operation, game_id, game).
+    
+    close() ends the server cursor whether or not iteration ever started.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def __iter__(self) -> Iterator[Tuple[str, uuid.UUID, Optional[Game]]]:
+        for change in self._stream:
+            operation = change['operationType']
+            if operation == 'replace':
+                operation = 'update'
+            doc = change.get('fullDocument')
+            game = GameSerializer.to_entity(doc) if doc else None
+            yield operation, change['documentKey']['_id'], game
+    
+    def close(self) -> None:
+        self._stream.close()
 
 
 class MongoGameRepository(GameRepository):
@@ -18,8 +56,9 @@ class MongoGameRepository(GameRepository):
         if 'games' not in db.list_collection_names():
             db.create_collection('games', capped=False)
         self.collection = db['games']
-        self.collection.create_index('updated_at')
-        self.collection.create_index('name')
+        self._indexes = LazyIndexes(self.collection, {
+            'updated_at': ('updated_at', {})
+        })
     
     def find_by_id(self, game_id: uuid.UUID) -> Optional[Game]:
         """Find a game by its ID"""
@@ -29,6 +68,12 @@ class MongoGameRepository(GameRepository):
         except Exception:
             return None
     
+    def find_by_ids(self, game_ids: List[uuid.UUID]) -> List[Game]:
+        """Find several games in one query, in the order of game_ids"""
+        docs = self.collection.find({'_id': {'$in': list(game_ids)}})
+        found = {doc['_id']: GameSerializer.to_entity(doc) for doc in docs}
+        return [found[game_id] for game_id in game_ids if game_id in found]
+    
     def save(self, game: Game) -> Game:
         """Save a game and return the saved entity"""
         doc = GameSerializer.to_doc(game)
@@ -39,6 +84,30 @@ class MongoGameRepository(GameRepository):
             True
         )
         return self.find_by_id(game.id)
+    
+    def save_many(self, games: List[Game]) -> List[Game]:
+        """Save several games in a single bulk write"""
+        if not games:
+            return []
+        
+        now = datetime.datetime.now(datetime.UTC)
+        docs = []
+        operations = []
+        for game in games:
+            doc = GameSerializer.to_doc(game)
+            doc['updated_at'] = now
+            docs.append(doc)
+            operations.append(
+                UpdateOne(
+                    filter={'_id': game.id},
+                    update={'$set': doc},
+                    upsert=True)
+            )
+        
+        self.collection.bulk_write(operations, ordered=False)
+        
+        # Everything written is already in memory - no need to read it back
+        return [GameSerializer.to_entity(doc) for doc in docs]
      
     def delete(self, game_id: uuid.UUID) -> bool:
         """Delete a game by ID"""
@@ -48,12 +117,32 @@ class MongoGameRepository(GameRepository):
         except Exception:
             return False
     
-    def find_all(self) -> List[Game]:
-        """Find all games"""
+    def find_all(self, summary: bool = False) -> List[Union[Game, GameSummary]]:
+        """Find all games, most recently updated first"""
+        self._indexes.ensure('updated_at')
+        if summary:
+            # Players, decks and the play zone never leave the server
+            docs = self.collection.find({}, _SUMMARY_FIELDS).sort('updated_at', -1)
+            return [GameSummarySerializer.to_entity(doc) for doc in docs]
         docs = self.collection.find().sort('updated_at', -1)
         return [GameSerializer.to_entity(doc) for doc in docs]
     
     def find_recent(self, limit: int = 10) -> List[Game]:
         """Find recent games"""
+        self._indexes.ensure('updated_at')
         docs = self.collection.find().sort('updated_at', -1).limit(limit)
-        return [GameSerializer.to_entity(doc) for doc in docs]
\ No newline at end of file
+        return [GameSerializer.to_entity(doc) for doc in docs]
+    
+    def watch(self) -> _GameChanges:
+        """
+        Yield lobby changes from a MongoDB change stream.
+        
+        Requires MongoDB to run as a replica set. Only phase changes that
+        MongoDB records as such (5.0+ delta updates) count as leaving the
+        lobby, so games already in progress stay filtered out.
+        
+        The stream is opened before this returns, so an unsupported
+        deployment raises OperationFailure here rather than mid-iteration.
+        """
+        stream = self.collection.watch([_LOBBY_CHANGES], full_document='updateLookup')
+        return _GameChanges(stream)
@@ -4,13 +4,17 @@ Each entity has a serializer class with to_doc() and to_entity() methods.
 """
 
 from datetime import datetime
+from operator import itemgetter
 from src.entities import (
-    Card, Deck, DeckList, DeckCard, Game, GamePhase, Player, 
+    Card, Deck, DeckList, DeckCard, DeckSummary, Game, GamePhase, GameSummary, Player, 
     PlayZone, CardInPlay, Position, DeckInPlay, Dial
 )
 from src.entities.encounter_deck import EncounterDeck
 from src.entities.encounter_deck_in_play import EncounterDeckInPlay
 
+# DeckCard field values from a card entry, in constructor order
+_deck_card_fields = itemgetter('code', 'name', 'quantity')
+
 
 class CardSerializer:
     @staticmethod
@@ -39,11 +43,7 @@ class DeckCardSerializer:
     def to_entity(doc: dict) -> DeckCard:
         
         """Convert MongoDB document to DeckCard entity"""
-        return DeckCard(
-            name=doc['name'],
-            code=doc['code'],
-            quantity=doc['quantity']
-        )
+        return DeckCard(*_deck_card_fields(doc))
     
     @staticmethod
     def to_doc(deck_card: DeckCard) -> dict:
@@ -58,10 +58,7 @@ class DeckListSerializer:
     @staticmethod
     def to_entity(doc: dict) -> DeckList:
         """Convert MongoDB document to DeckList entity"""
-        cards = list(
-            DeckCardSerializer.to_entity(c)
-            for c in doc.get('cards', [])
-        )
+        cards = [DeckCard(*_deck_card_fields(c)) for c in doc.get('cards', [])]
         return DeckList(
             id=doc['deck_id'],
             name=doc['name'],
@@ -79,6 +76,17 @@ class DeckListSerializer:
             'is_module': not deck_list.id.isdigit()
         }
 
+
+class DeckSummarySerializer:
+    @staticmethod
+    def to_entity(doc: dict) -> DeckSummary:
+        """Convert a projected MongoDB document to DeckSummary entity"""
+        return DeckSummary(
+            id=doc['deck_id'],
+            name=doc['name'],
+            total_quantity=doc.get('total_quantity', 0)
+        )
+
 class DeckSerializer:
     @staticmethod
     def to_entity(doc: dict) -> Deck:
@@ -328,6 +336,18 @@ class GameSerializer:
         
         return doc
 
+class GameSummarySerializer:
+    @staticmethod
+    def to_entity(doc: dict) -> GameSummary:
+        """Convert a projected MongoDB document to GameSummary entity"""
+        return GameSummary(
+            id=doc['_id'],
+            name=doc['name'],
+            host=doc.get('host', ''),
+            phase=GamePhase(doc.get('phase', 'lobby')),
+            updated_at=doc.get('updated_at')
+        )
+
 # Add this to src/repositories/serializers.py in the EncounterDeckSerializer class
 
 class EncounterDeckSerializer:
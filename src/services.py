@@ -0,0 +1,74 @@
+"""
+Lazily built application services.
+
+Each repository and gateway is constructed once, on first access, so a
+process that only serves some of the endpoints never builds (or imports)
+the dependencies of the others.
+"""
+
+from functools import cached_property
+
+from pymongo.database import Database
+
+from src.config import AppConfig
+
+
+class Services:
+    """
+    Container of the repositories and gateways interactors are built from.
+
+    Access happens while a controller is being wired (under the
+    LazyControllerRegistry lock), so each property is built exactly once.
+    """
+
+    def __init__(self, config: AppConfig, db: Database):
+        self.config = config
+        self.db = db
+
+    @cached_property
+    def card_repo(self):
+        from src.repositories import (
+            MongoCardRepository, CoalescingCardRepository, CachedCardRepository
+        )
+        # Reads are served from memory; the misses and the initial catalog
+        # load that do reach MongoDB are coalesced
+        return CachedCardRepository(CoalescingCardRepository(
+            MongoCardRepository(self.db),
+            read_methods=('find_by_code', 'exists', 'find_all'),
+            write_methods=('save', 'save_all')
+        ))
+
+    @cached_property
+    def deck_repo(self):
+        from src.repositories import MongoDeckRepository
+        # Its own TTL caches dedupe repeated reads and are evicted on every
+        # write, so decks aren't also wrapped in a CoalescingRepository
+        return MongoDeckRepository(self.db)
+
+    @cached_property
+    def game_repo(self):
+        from src.repositories import MongoGameRepository
+        return MongoGameRepository(self.db)
+
+    @cached_property
+    def save_executor(self):
+        # Decks imported on a GET are saved here, off the request path
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(max_workers=4, thread_name_prefix='deck-save')
+
+    @cached_property
+    def marvelcdb_gateway(self):
+        # The gateway package pulls in requests, bs4, PIL and playwright
+        from src.gateways import MarvelCDBClient
+        return MarvelCDBClient(self.config.marvelcdb)
+
+    @cached_property
+    def image_storage(self):
+        from src.gateways import LocalImageStorage
+        return LocalImageStorage(self.config.image_storage)
+
+    def close(self) -> None:
+        """Shut down the services that were built, finishing queued saves"""
+        save_executor = self.__dict__.get('save_executor')
+        if save_executor is not None:
+            save_executor.shutdown(wait=True)
@@ -14,12 +14,13 @@ import uuid
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from flask import Flask
-from src.controllers import card_bp, deck_bp, game_bp
+from src.controllers import card_bp, deck_bp, game_bp, lobby_bp
 import datetime
 import src.controllers.card_controller as card_controller
 import src.controllers.deck_controller as deck_controller
 import src.controllers.game_controller as game_controller
-from src.entities import Card, Deck, DeckCard, Game, GamePhase, Player, PlayZone, Position, CardInPlay
+import src.controllers.lobby_controller as lobby_controller
+from src.entities import Card, Deck, DeckCard, DeckList, DeckSummary, Game, GamePhase, Player, PlayZone, Position, CardInPlay
 
 
 @pytest.fixture
@@ -160,6 +161,29 @@ class TestCardController:
             assert data['count'] == 0
             assert len(data['results']) == 0
     
+    def test_search_cards_paginates(self, client):
+        """Test search pages are bounded and point at the next page"""
+        interactors = [Mock() for _ in range(6)]
+        card_controller.init_card_controller(*interactors)
+        search = interactors[1]
+        search.execute.return_value = [
+            Card(code='card1', name='Iron Man'),
+            Card(code='card2', name='Iron Patriot'),
+            Card(code='card3', name='Ironheart')
+        ]
+        
+        data = client.get('/api/cards/search?q=Iron&limit=2&offset=4').get_json()
+        
+        search.execute.assert_called_once_with('Iron', limit=3, offset=4)
+        assert [r['code'] for r in data['results']] == ['card1', 'card2']
+        assert data['next_offset'] == 6
+        
+        search.execute.return_value = search.execute.return_value[:1]
+        data = client.get('/api/cards/search?q=Iron&limit=1000').get_json()
+        
+        assert search.execute.call_args.kwargs['limit'] == card_controller.SEARCH_MAX_PAGE_SIZE + 1
+        assert data['next_offset'] is None
+    
     def test_import_card_success(self, app, client, mock_card_interactor):
         """Test importing a card from MarvelCDB"""
         with app.app_context():
@@ -315,6 +339,98 @@ class TestDeckController:
             data = response.get_json()
             assert data['count'] == 0
             assert len(data['decks']) == 0
+
+    def test_list_decks_response_shape(self, client):
+        """Test deck list is encoded from deck summaries"""
+        interactors = [Mock() for _ in range(7)]
+        deck_controller.init_deck_controller(*interactors)
+        interactors[0].execute.return_value = [
+            DeckSummary(id='123', name='Iron Deck', total_quantity=40)
+        ]
+
+        response = client.get('/api/decks')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {
+            'decks': [{
+                'id': '123',
+                'name': 'Iron Deck',
+                'card_count': 40,
+                'source_url': 'https://marvelcdb.com/deck/view/123'
+            }],
+            'count': 1
+        }
+
+    def test_list_decks_is_conditional(self, client):
+        """Test a repeat deck list poll with a matching ETag gets a 304"""
+        interactors = [Mock() for _ in range(7)]
+        deck_controller.init_deck_controller(*interactors)
+        interactors[0].execute.return_value = [DeckSummary(id='123', name='Iron Deck', total_quantity=40)]
+
+        response = client.get('/api/decks')
+        assert response.get_json()['decks'][0]['card_count'] == 40
+
+        revisit = client.get('/api/decks', headers={'If-None-Match': response.headers['ETag']})
+        assert revisit.status_code == 304
+
+        interactors[0].execute.return_value = []
+        changed = client.get('/api/decks', headers={'If-None-Match': response.headers['ETag']})
+        assert changed.status_code == 200
+    
+    def test_get_deck_is_conditional(self, client):
+        """Test a repeat deck fetch with a matching ETag gets a 304"""
+        interactors = [Mock() for _ in range(7)]
+        deck_controller.init_deck_controller(*interactors)
+        interactors[1].execute.return_value = DeckList(id='123', name='Iron Deck', cards=[])
+
+        response = client.get('/api/decks/123')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+
+        revisit = client.get('/api/decks/123', headers={'If-None-Match': etag})
+        assert revisit.status_code == 304
+        assert revisit.get_data() == b''
+    
+    def test_get_deck_saves_imported_deck_in_background(self, client):
+        """Test a deck imported on fetch is saved once, off the request path"""
+        interactors = [Mock() for _ in range(7)]
+        deck_controller.init_deck_controller(*interactors)
+        interactors[1].execute.return_value = None
+        interactors[2].execute.return_value = DeckList(id='123', name='Iron Deck', cards=[])
+        
+        executor = interactors[6]
+        
+        assert client.get('/api/decks/123').status_code == 200
+        second = client.get('/api/decks/123')
+        assert second.status_code == 200
+        assert second.get_json()['name'] == 'Iron Deck'
+        
+        # The second fetch was served the deck still waiting to be saved
+        interactors[2].execute.assert_called_once()
+        executor.submit.assert_called_once()
+        interactors[5].execute.assert_not_called()
+        executor.submit.call_args[0][0]()
+        
+        interactors[5].execute.assert_called_once_with(interactors[2].execute.return_value)
+        assert deck_controller._pending_saves == {}
+    
+    def test_get_deck_preloads_card_images(self, client):
+        """Test a deck response hints each distinct card image for preload"""
+        interactors = [Mock() for _ in range(7)]
+        deck_controller.init_deck_controller(*interactors)
+        interactors[1].execute.return_value = DeckList(id='123', name='Iron Deck', cards=[
+            DeckCard(code='01001a', name='Spider-Man', quantity=1),
+            DeckCard(code='01002', name='Web-Shooter', quantity=3),
+            DeckCard(code='01001a', name='Spider-Man', quantity=1)
+        ])
+
+        response = client.get('/api/decks/123')
+
+        assert response.headers['Link'] == (
+            '</api/cards/01001a/image>; rel=preload; as=image, '
+            '</api/cards/01002/image>; rel=preload; as=image'
+        )
     
     def test_get_deck_success(self, app, client, mock_deck_interactor):
         """Test getting a single deck"""
@@ -429,6 +545,19 @@ class TestDeckController:
 class TestGameController:
     """Test game API endpoints"""
     
+    def test_get_game_is_conditional(self, client):
+        """Test a repeat game fetch with a matching ETag gets a 304"""
+        interactors = [Mock() for _ in range(9)]
+        game_controller.init_game_controller(*interactors)
+        interactors[1].execute.return_value = Game(id=uuid.uuid4(), name='Game 1', host='host_player1')
+
+        response = client.get('/api/games/abc')
+        assert response.status_code == 200
+        assert response.get_json()['phase'] == GamePhase.LOBBY.value
+
+        revisit = client.get('/api/games/abc', headers={'If-None-Match': response.headers['ETag']})
+        assert revisit.status_code == 304
+    
     def test_list_games_success(self, app, client, mock_game_interactor):
         """Test listing all games"""
         with app.app_context():
@@ -678,4 +807,262 @@ class TestErrorHandling:
             
             assert response.status_code == 500
             data = response.get_json()
-            assert 'error' in data
\ No newline at end of file
+            assert 'error' in data
+
+
+class TestLobbyController:
+    """Test lobby API endpoints"""
+    
+    @pytest.fixture
+    def lobby_interactors(self):
+        """Wire the lobby controller with one mock per interactor"""
+        interactors = [Mock() for _ in range(14)]
+        lobby_controller.init_lobby_controller(*interactors)
+        return interactors
+    
+    @pytest.fixture
+    def lobby_client(self, lobby_interactors):
+        """Create test client with the lobby blueprint registered"""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.register_blueprint(lobby_bp)
+        return app.test_client()
+    
+    def test_list_lobbies_response_shape(self, lobby_client, lobby_interactors):
+        """Test lobby list is encoded from response DTOs"""
+        game = Game(
+            name='Test Game',
+            host='Alice',
+            players=(Player(name='Alice', is_host=True), Player(name='Bob'))
+        )
+        lobby_interactors[8].execute.return_value = [game]
+        
+        response = lobby_client.get('/api/lobbies')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {
+            'lobbies': [{
+                'id': str(game.id),
+                'name': 'Test Game',
+                'host': 'Alice',
+                'players': 2,
+                'phase': 'lobby'
+            }],
+            'count': 1
+        }
+    
+    def test_toggle_ready_response_shape(self, lobby_client, lobby_interactors):
+        """Test toggle ready returns every player's ready state"""
+        game = Game(
+            name='Test Game',
+            host='Alice',
+            players=(Player(name='Alice', is_host=True, is_ready=True),)
+        )
+        lobby_interactors[5].execute.return_value = game
+        
+        response = lobby_client.post('/api/lobbies/abc/ready', json={'username': 'Alice'})
+        
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'success': True,
+            'players': [{'name': 'Alice', 'is_ready': True}]
+        }
+    
+    def test_lobby_stream_pushes_changes(self, lobby_client, lobby_interactors):
+        """Test lobby stream emits one server-sent event per change"""
+        game = Game(name='Test Game', host='Alice', players=(Player(name='Alice'),))
+        changes = MagicMock()
+        changes.__iter__.return_value = iter([
+            ('upsert', str(game.id), game),
+            ('delete', 'gone', None)
+        ])
+        lobby_interactors[13].execute.return_value = changes
+        
+        response = lobby_client.get('/api/lobbies/stream')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        events = [e for e in response.get_data(as_text=True).split('\n\n') if e]
+        assert len(events) == 2
+        assert '"op":"upsert"' in events[0]
+        assert '"players":1' in events[0]
+        assert events[1] == 'data: {"op":"delete","id":"gone","lobby":null}'
+    
+    def test_lobby_stream_closed_before_first_event(self, lobby_client, lobby_interactors):
+        """Test a client leaving before any change still stops the watch"""
+        changes = MagicMock()
+        lobby_interactors[13].execute.return_value = changes
+        
+        with lobby_client.application.test_request_context('/api/lobbies/stream'):
+            response = lobby_controller.lobby_stream()
+        response.close()
+        
+        changes.__iter__.assert_not_called()
+        changes.close.assert_called_once()
+    
+    def test_lobby_stream_unavailable(self, lobby_client, lobby_interactors):
+        """Test a MongoDB that can't watch is reported before the stream starts"""
+        from pymongo.errors import OperationFailure
+        lobby_interactors[13].execute.side_effect = OperationFailure(
+            'The $changeStream stage is only supported on replica sets'
+        )
+        
+        response = lobby_client.get('/api/lobbies/stream')
+        
+        assert response.status_code == 503
+        assert response.get_json() == {'error': 'Lobby stream unavailable'}
+    
+    def test_lobby_stream_ends_with_error_event(self, lobby_client, lobby_interactors):
+        """Test a change stream failure mid-stream ends with an error event"""
+        from pymongo.errors import CursorNotFound
+        game = Game(name='Test Game', host='Alice', players=(Player(name='Alice'),))
+        
+        def changes():
+            yield 'upsert', str(game.id), game
+            raise CursorNotFound('cursor id not found')
+        
+        lobby_interactors[13].execute.return_value = changes()
+        
+        response = lobby_client.get('/api/lobbies/stream')
+        
+        assert response.status_code == 200
+        events = [e for e in response.get_data(as_text=True).split('\n\n') if e]
+        assert len(events) == 2
+        assert '"op":"upsert"' in events[0]
+        assert events[1] == 'event: error\ndata: {"error":"Lobby stream failed"}'
+
+
+class TestLazyControllerRegistry:
+    """Test controllers are wired on their first request"""
+    
+    def test_wires_once_on_first_request(self):
+        """Test the wiring callback runs once, before the first request"""
+        from flask import Blueprint
+        from src.controllers.registry import LazyControllerRegistry
+        
+        bp = Blueprint('lazy', __name__)
+        state = {}
+        
+        @bp.route('/ping')
+        def ping():
+            return state['reply']
+        
+        wire = Mock(side_effect=lambda: state.update(reply='pong'))
+        app = Flask(__name__)
+        registry = LazyControllerRegistry(app)
+        registry.register(bp, '/api/lazy', wire)
+        client = app.test_client()
+        
+        assert not registry.is_wired('lazy')
+        assert client.get('/health').status_code == 404
+        wire.assert_not_called()
+        
+        assert client.get('/api/lazy/ping').get_data(as_text=True) == 'pong'
+        assert client.get('/api/lazy/ping').get_data(as_text=True) == 'pong'
+        wire.assert_called_once()
+        assert registry.is_wired('lazy')
+
+
+class TestCors:
+    """Test CORS headers"""
+    
+    def test_headers_on_responses_and_preflight(self):
+        """Test every response, including preflight, carries CORS headers"""
+        from src.middleware import setup_cors
+        
+        app = Flask(__name__)
+        setup_cors(app, 'https://example.com')
+        
+        @app.route('/ping', methods=['POST'])
+        def ping():
+            return 'pong'
+        
+        client = app.test_client()
+        
+        response = client.post('/ping')
+        assert response.headers['Access-Control-Allow-Origin'] == 'https://example.com'
+        assert response.headers['Vary'] == 'Origin'
+        
+        preflight = client.options('/ping', headers={'Origin': 'https://example.com'})
+        assert preflight.status_code == 200
+        assert 'POST' in preflight.headers['Access-Control-Allow-Methods']
+        assert preflight.headers['Access-Control-Allow-Headers'] == 'Content-Type,Authorization'
+
+
+class TestCompression:
+    """Test gzip compression of JSON responses"""
+    
+    def test_large_json_is_gzipped(self):
+        """Test large JSON bodies are gzipped only for clients accepting it"""
+        import gzip
+        from flask import jsonify
+        from src.middleware import setup_compression
+        
+        app = Flask(__name__)
+        setup_compression(app, min_size=100)
+        
+        @app.route('/big')
+        def big():
+            return jsonify({'codes': ['01001a'] * 100})
+        
+        @app.route('/small')
+        def small():
+            return jsonify({'success': True})
+        
+        client = app.test_client()
+        
+        response = client.get('/big', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert gzip.decompress(response.get_data()) == client.get('/big').get_data()
+        
+        assert 'Content-Encoding' not in client.get('/big').headers
+        small_response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in small_response.headers
+
+
+class TestCreateApp:
+    """Test the application factory's resource cleanup"""
+    
+    def test_mongo_client_closed_once(self):
+        """Test the app's MongoDB client closes on teardown, and only once"""
+        from src.app import create_app
+        
+        with patch('src.app.MongoClient') as mongo_client:
+            app = create_app()
+        
+        app.close_services()
+        app.close_services()
+        mongo_client.return_value.close.assert_called_once()
+    
+    def test_dropped_app_closes_its_client(self):
+        """Test building apps doesn't keep every client alive until exit"""
+        import gc
+        from src.app import create_app
+        
+        with patch('src.app.MongoClient') as mongo_client:
+            app = create_app()
+        close = app.close_services
+        
+        del app
+        gc.collect()
+        
+        assert not close.alive
+        mongo_client.return_value.close.assert_called_once()
+    
+    def test_close_finishes_queued_saves(self):
+        """Test closing the services waits for queued saves, then refuses more"""
+        import threading
+        from src.services import Services
+        
+        services = Services(config=None, db=None)
+        services.close()  # nothing built yet, nothing to shut down
+        
+        saved = threading.Event()
+        services.save_executor.submit(saved.set)
+        services.close()
+        
+        assert saved.is_set()
+        with pytest.raises(RuntimeError):
+            services.save_executor.submit(saved.set)
@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import shutil
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock, patch
 from src.entities.deck import DeckList
@@ -46,6 +47,27 @@ class TestLocalImageStorage:
         with open(path, 'rb') as f:
             assert f.read() == image_data
     
+    def test_get_image_bytes(self, storage_config, temp_dir):
+        """Test stored images are returned undecoded with their mimetype"""
+        storage = LocalImageStorage(storage_config)
+        Path(temp_dir, '01001a.jpg').write_bytes(b'jpeg data')
+        Path(temp_dir, '01002a.png').write_bytes(b'png data')
+        
+        assert storage.get_image_bytes('01001a') == (b'jpeg data', 'image/jpeg')
+        assert storage.get_image_bytes('01002a') == (b'png data', 'image/png')
+        assert storage.get_image_bytes('nonexistent') is None
+    
+    def test_open_image_stream(self, storage_config, temp_dir):
+        """Test stored images are opened for streaming"""
+        storage = LocalImageStorage(storage_config)
+        Path(temp_dir, '01001a.jpg').write_bytes(b'jpeg data')
+        
+        stream, mimetype = storage.open_image_stream('01001a')
+        with stream:
+            assert stream.read() == b'jpeg data'
+        assert mimetype == 'image/jpeg'
+        assert storage.open_image_stream('nonexistent') is None
+    
     def test_image_not_exists(self, storage_config):
         """Test checking non-existent image"""
         storage = LocalImageStorage(storage_config)
@@ -201,6 +223,10 @@ class TestMarvelCDBClient:
         assert result.code == '01001a'
         assert result.name == 'Spider-Man'
         assert 'Response ability' in result.text
+        
+        # A second fetch of the same card is served from the client's cache
+        assert client.get_card_from_code('01001a') is result
+        mock_get.assert_called_once()
     
     @patch('requests.Session.get')
     def test_get_card_info_failure(self, mock_get, client):
@@ -210,6 +236,31 @@ class TestMarvelCDBClient:
         with pytest.raises(Exception, match="Network error"):
             client.get_card_from_code('01001a')
     
+    @patch('requests.Session.get')
+    def test_get_card_image_uses_session(self, mock_get, client):
+        """Test card images are downloaded over the pooled session"""
+        from PIL import Image
+        
+        png = BytesIO()
+        Image.new('RGB', (2, 2)).save(png, 'PNG')
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = png.getvalue()
+        mock_get.return_value = mock_response
+        
+        image = client.get_card_image('01001a')
+        
+        assert image.size == (2, 2)
+        mock_get.assert_called_once()
+        assert mock_get.call_args[0][0].endswith('/bundles/cards/01001a.png')
+    
+    def test_session_retries_gateway_errors(self, client):
+        """Test the session retries transient MarvelCDB errors"""
+        adapter = client.session.get_adapter('https://marvelcdb.com')
+        
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+    
     @patch('requests.Session.get')
     def test_get_card_image_url(self, mock_get, client):
         """Test getting card image URL"""
@@ -53,6 +53,22 @@ class TestCardInteractorAdvanced:
         assert result == existing_card
         card_interactor.card_repo.save.assert_not_called()
     
+    def test_import_cards_bulk_saves_once(self, card_interactor):
+        """Test bulk import saves all new cards in a single batch"""
+        card_interactor.card_repo.find_missing_codes = Mock(return_value={'card1', 'card2'})
+        card_interactor.marvelcdb.get_card_info = Mock(
+            side_effect=lambda code: {'code': code, 'name': code.upper()}
+        )
+        
+        with patch.object(card_interactor, '_download_card_image'):
+            card_interactor.import_cards_bulk(['card1', 'card2', 'card3'])
+        
+        card_interactor.card_repo.save_all.assert_called_once_with([
+            Card(code='card1', name='CARD1'),
+            Card(code='card2', name='CARD2')
+        ])
+        card_interactor.card_repo.save.assert_not_called()
+    
     def test_search_cards_by_name(self, card_interactor):
         """Test searching cards by name"""
         cards = (
@@ -339,4 +339,49 @@ class TestLobbyLifecycle:
         interactor.join_lobby(lobby.id, "Bob")
         
         with pytest.raises(ValueError, match="Only host"):
-            interactor.delete_lobby(lobby.id, "Bob")
\ No newline at end of file
+            interactor.delete_lobby(lobby.id, "Bob")
+
+class TestWatchLobbies:
+    """Test the lobby change stream"""
+    
+    def test_only_lobby_changes_are_streamed(self):
+        """Test games in progress never reach lobby watchers"""
+        from unittest.mock import Mock
+        from src.interactors.lobby import WatchLobbiesInteractor
+        
+        lobby = Game(name="Open", host="Alice")
+        started = Game(name="Started", host="Bob", phase=GamePhase.IN_PROGRESS)
+        game_repo = Mock()
+        game_repo.watch.return_value = iter([
+            ('insert', lobby.id, lobby),
+            ('insert', started.id, started),
+            ('update', started.id, started),
+            ('delete', lobby.id, None),
+        ])
+        
+        changes = list(WatchLobbiesInteractor(game_repo).execute())
+        
+        assert changes == [
+            ('upsert', str(lobby.id), lobby),
+            ('delete', str(started.id), None),
+            ('delete', str(lobby.id), None),
+        ]
+    
+    def test_change_stream_is_filtered_server_side(self, test_db):
+        """Test the change stream only matches lobby writes, phase changes and deletes"""
+        from unittest.mock import MagicMock, patch
+        from src.repositories.mongo_game_repository import _LOBBY_CHANGES
+        
+        repo = MongoGameRepository(test_db)
+        with patch.object(type(repo.collection), 'watch', create=True) as watch:
+            watch.return_value = MagicMock()
+            list(repo.watch())
+            watch.return_value.close.assert_not_called()
+            # Closing needs no iteration to end the server cursor
+            repo.watch().close()
+        
+        watch.return_value.close.assert_called_once()
+        assert watch.call_args[0][0] == [_LOBBY_CHANGES]
+        conditions = _LOBBY_CHANGES['$match']['$or']
+        assert {'operationType': 'delete'} in conditions
+        assert any(c.get('fullDocument.phase') == 'lobby' for c in conditions)
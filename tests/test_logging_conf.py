@@ -0,0 +1,67 @@
+"""
+Tests for the background audit log writer.
+"""
+
+import json
+import logging
+import time
+import pytest
+from unittest.mock import patch
+
+from src import logging_conf
+
+
+@pytest.fixture
+def audit_logger(tmp_path, monkeypatch):
+    """AuditLogger writing to a temp LOGS_DIR, detached from the global one"""
+    monkeypatch.setattr(logging_conf, 'LOGS_DIR', tmp_path)
+    audit = logging.getLogger('audit')
+    handlers = audit.handlers[:]
+    audit.handlers.clear()
+    with patch('src.logging_conf.atexit.register'):
+        logger = logging_conf.AuditLogger()
+    monkeypatch.setattr(logging_conf, 'audit_logger', logger)
+    yield logger
+    if logger._listener._thread is not None:
+        logger._listener.stop()
+    for handler in logger._listener.handlers:
+        handler.close()
+    audit.handlers[:] = handlers
+
+
+def read_audit_log(path):
+    """Parse the JSON lines written so far"""
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestAuditLogger:
+    """Test AuditLogger and its batching writer"""
+
+    def test_lone_record_is_written_once_queue_is_empty(self, audit_logger, tmp_path):
+        """Test a single record is flushed without waiting for more"""
+        logging_conf.audit_logger.log_action('import_deck', user_id='alice')
+
+        deadline = time.monotonic() + 2
+        while not read_audit_log(tmp_path / 'audit.log') and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        (entry,) = read_audit_log(tmp_path / 'audit.log')
+        assert entry['action'] == 'import_deck'
+        assert entry['user_id'] == 'alice'
+
+    def test_burst_is_written_in_order(self, audit_logger, tmp_path):
+        """Test every record of a burst reaches the file, in order, once stopped"""
+        for i in range(500):
+            logging_conf.audit_logger.log_action(
+                'draw_card', endpoint='/api/games/g1/draw', method='POST',
+                status_code=200, details={'seq': i}
+            )
+
+        audit_logger._listener.stop()
+
+        entries = read_audit_log(tmp_path / 'audit.log')
+        assert [entry['details']['seq'] for entry in entries] == list(range(500))
+        assert all(entry['action'] == 'draw_card' for entry in entries)
+        assert entries[0]['user_id'] == 'anonymous'
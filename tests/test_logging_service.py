@@ -0,0 +1,97 @@
+"""
+Tests for LoggingService sinks: the Redis stream and the MongoDB buffer.
+"""
+
+import datetime
+import pytest
+from unittest.mock import MagicMock, patch
+
+from logging_service import LoggingService, LogLevel
+
+
+class FakeRedis:
+    """Records stream appends instead of talking to a server"""
+
+    def __init__(self, *args, **kwargs):
+        self.entries = []
+
+    def ping(self):
+        return True
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.entries.append((name, fields, maxlen, approximate))
+
+
+@pytest.fixture
+def service(tmp_path):
+    """LoggingService with a fake Redis stream and a mocked log collection"""
+    with patch('logging_service.atexit.register'), patch('redis.Redis', FakeRedis):
+        service = LoggingService(
+            app_name='test-logging',
+            verbosity=LogLevel.DEBUG,
+            log_dir=str(tmp_path),
+            redis_url='redis://localhost:6379/0',
+            redis_stream_maxlen=1000
+        )
+    service.db = {'logs': MagicMock()}
+    service.log_buffer.clear()
+    service.redis.entries.clear()
+    return service
+
+
+class TestLoggingService:
+    """Test where LoggingService sends each level"""
+
+    def test_sub_error_levels_go_to_redis_stream(self, service):
+        """Test DEBUG/INFO/WARNING are appended to the capped stream"""
+        service.debug('drew a card')
+        service.info('game saved', game_id=42)
+        service.warning('slow query')
+
+        assert [fields['level'] for _, fields, _, _ in service.redis.entries] == [
+            'DEBUG', 'INFO', 'WARNING'
+        ]
+        name, fields, maxlen, approximate = service.redis.entries[1]
+        assert name == 'logs:test-logging'
+        assert fields['message'] == 'game saved'
+        assert fields['game_id'] == '42'
+        assert maxlen == 1000
+        assert approximate is True
+        assert service.log_buffer == []
+
+    def test_errors_go_to_mongo_buffer(self, service):
+        """Test ERROR/CRITICAL skip Redis and are buffered for MongoDB"""
+        service.error('save failed', deck_id='abc')
+        service.critical('database down')
+
+        assert service.redis.entries == []
+        assert [entry['level'] for entry in service.log_buffer] == ['ERROR', 'CRITICAL']
+        assert service.log_buffer[0]['deck_id'] == 'abc'
+
+    def test_flush_converts_ts_ns_to_timestamp(self, service):
+        """Test buffered entries are written with a datetime timestamp"""
+        before = datetime.datetime.now(datetime.UTC)
+        service.error('save failed')
+
+        service._on_shutdown()
+
+        collection = service.db['logs']
+        collection.insert_many.assert_called_once()
+        (entry,) = collection.insert_many.call_args[0][0]
+        assert 'ts_ns' not in entry
+        assert isinstance(entry['timestamp'], datetime.datetime)
+        assert entry['timestamp'].tzinfo is not None
+        assert before - datetime.timedelta(seconds=1) <= entry['timestamp']
+        assert entry['timestamp'] <= datetime.datetime.now(datetime.UTC)
+
+    def test_without_redis_everything_is_buffered(self, tmp_path):
+        """Test no Redis URL keeps every level in the MongoDB buffer"""
+        with patch('logging_service.atexit.register'):
+            service = LoggingService(app_name='test-logging-plain', log_dir=str(tmp_path))
+        service.db = {'logs': MagicMock()}
+
+        service.info('game saved')
+        service.error('save failed')
+
+        assert service.redis is None
+        assert [entry['level'] for entry in service.log_buffer] == ['INFO', 'ERROR']
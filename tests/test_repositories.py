@@ -6,7 +6,7 @@ from src.entities.deck_in_play import DeckInPlay
 from src.entities.encounter_deck import EncounterDeck
 from src.entities.encounter_deck_in_play import EncounterDeckInPlay
 from src.repositories import MongoCardRepository, MongoDeckRepository, MongoGameRepository
-from src.entities import Card, Deck, DeckCard, Game, GamePhase, CardInPlay, Position, Player, PlayZone
+from src.entities import Card, Deck, DeckCard, DeckList, Game, GamePhase, CardInPlay, Position, Player, PlayZone
 
 
 class TestMongoCardRepository:
@@ -44,6 +44,7 @@ class TestMongoCardRepository:
         
         saved = repo.save_all(cards)
         assert len(saved) == 3
+        assert test_db['cards'].count_documents({}) == 3
     
     def test_find_by_codes(self, test_db):
         """Test finding multiple cards"""
@@ -57,6 +58,15 @@ class TestMongoCardRepository:
         found = repo.find_by_codes(['01001a', '01002a'])
         assert len(found) == 2
     
+    def test_find_missing_codes(self, test_db):
+        """Test finding which codes have no stored card"""
+        repo = MongoCardRepository(test_db)
+        
+        repo.save(Card(code='01001a', name='Spider-Man'))
+        
+        assert repo.find_missing_codes(['01001a', '01002a']) == {'01002a'}
+        assert repo.find_missing_codes([]) == set()
+    
     def test_card_exists(self, test_db):
         """Test checking card existence"""
         repo = MongoCardRepository(test_db)
@@ -82,6 +92,87 @@ class TestMongoCardRepository:
         results = repo.search_by_name('iron')
         assert len(results) == 1
 
+    
+    def test_find_all_cards(self, test_db):
+        """Test paging through all cards"""
+        repo = MongoCardRepository(test_db)
+        
+        repo.save_all([
+            Card(code='01002a', name='Iron Man'),
+            Card(code='01001a', name='Spider-Man'),
+            Card(code='01003a', name='Captain Marvel'),
+        ])
+        
+        assert [c.code for c in repo.find_all(limit=2)] == ['01001a', '01002a']
+        assert [c.code for c in repo.find_all(limit=2, offset=2)] == ['01003a']
+        assert len(repo.find_all(limit=0)) == 3
+
+    
+    def test_iter_all_cards(self, test_db):
+        """Test streaming every card in code order"""
+        repo = MongoCardRepository(test_db)
+        
+        repo.save_all([
+            Card(code='01002a', name='Iron Man'),
+            Card(code='01001a', name='Spider-Man'),
+        ])
+        
+        cards = repo.iter_all(batch_size=1)
+        assert next(cards).code == '01001a'
+        assert [c.code for c in cards] == ['01002a']
+    
+    def test_indexes_created_on_first_use(self, test_db):
+        """Test an index is only created once a query needs it"""
+        repo = MongoCardRepository(test_db)
+        assert 'code_1' not in test_db['cards'].index_information()
+        
+        repo.find_by_code('01001a')
+        indexes = test_db['cards'].index_information()
+        assert indexes['code_1']['unique'] is True
+        assert 'name_1' not in indexes
+        
+        repo.search_by_name('spider')
+        assert 'name_1' in test_db['cards'].index_information()
+
+class TestCachedCardRepository:
+    """Test CachedCardRepository"""
+    
+    def test_reads_are_served_from_memory(self, test_db):
+        """Test the catalog is loaded once and kept current on writes"""
+        from src.repositories import CachedCardRepository
+        
+        MongoCardRepository(test_db).save_all([
+            Card(code='01001a', name='Spider-Man'),
+            Card(code='01002a', name='Spider-Woman'),
+            Card(code='01003a', name='Iron Man'),
+        ])
+        repo = CachedCardRepository(MongoCardRepository(test_db))
+        
+        assert repo.find_by_code('01001a').name == 'Spider-Man'
+        # Changes behind the cache's back aren't seen once it's loaded
+        test_db['cards'].delete_many({})
+        assert repo.exists('01003a') is True
+        assert [c.code for c in repo.search_by_name('spider')] == ['01001a', '01002a']
+        assert [c.code for c in repo.search_by_name('MAN')] == ['01001a', '01002a', '01003a']
+        assert [c.code for c in repo.search_by_name('MAN', limit=2, offset=1)] == ['01002a', '01003a']
+        assert len(repo.find_by_codes(['01001a', '01003a'])) == 2
+        
+        repo.save(Card(code='01004a', name='She-Hulk'))
+        assert repo.find_by_code('01004a').name == 'She-Hulk'
+        assert [c.code for c in repo.search_by_name('hulk')] == ['01004a']
+    
+    def test_misses_fall_through(self, test_db):
+        """Test cards written by another process are still found"""
+        from src.repositories import CachedCardRepository
+        
+        repo = CachedCardRepository(MongoCardRepository(test_db))
+        assert repo.find_by_code('01001a') is None
+        assert repo.find_missing_codes(['01001a', '01002a']) == {'01001a', '01002a'}
+        
+        MongoCardRepository(test_db).save(Card(code='01001a', name='Spider-Man'))
+        assert repo.find_missing_codes(['01001a', '01002a']) == {'01002a'}
+        assert repo.find_by_code('01001a').name == 'Spider-Man'
+        assert [c.code for c in repo.search_by_name('spider')] == ['01001a']
 
 class TestMongoDeckRepository:
     """Test MongoDeckRepository"""
@@ -161,6 +252,126 @@ class TestMongoDeckRepository:
         all_decks = repo.find_all()
         assert len(all_decks) >= 2
 
+    
+    def test_save_many_decks(self, test_db):
+        """Test saving several decks in one bulk write"""
+        repo = MongoDeckRepository(test_db)
+        
+        saved = repo.save_many([
+            DeckList(id='1', name='Deck 1', cards=[DeckCard(code='01001a', name='Spider-Man', quantity=1)]),
+            DeckList(id='2', name='Deck 2', cards=[DeckCard(code='01002a', name='Iron Man', quantity=3)]),
+        ])
+        
+        assert [d.id for d in saved] == ['1', '2']
+        found = repo.find_by_id('2')
+        assert found is not None
+        assert found.cards[0].quantity == 3
+
+    def test_find_by_ids(self, test_db):
+        """Test finding several decks keeps the requested order"""
+        repo = MongoDeckRepository(test_db)
+        repo.save_many([
+            DeckList(id='1', name='Deck 1', cards=[]),
+            DeckList(id='2', name='Deck 2', cards=[]),
+            DeckList(id='3', name='Deck 3', cards=[]),
+        ])
+        repo.find_by_id('3')
+
+        found = repo.find_by_ids(['3', 'missing', '1'])
+        assert [d.id for d in found] == ['3', '1']
+
+    def test_find_by_id_is_cached_until_write(self, test_db):
+        """Test repeated reads hit the cache and writes invalidate it"""
+        repo = MongoDeckRepository(test_db)
+        repo.save(DeckList(id='1', name='Deck 1', cards=[]))
+
+        first = repo.find_by_id('1')
+        assert repo.find_by_id('1') is first
+
+        repo.save(DeckList(id='1', name='Renamed', cards=[]))
+        assert repo.find_by_id('1').name == 'Renamed'
+
+        repo.delete('1')
+        assert repo.find_by_id('1') is None
+
+    def test_read_racing_a_write_is_not_cached(self, test_db):
+        """Test a read between eviction and write can't pin the old deck"""
+        from unittest.mock import patch
+        repo = MongoDeckRepository(test_db)
+        repo.save(DeckList(id='1', name='Deck 1', cards=[]))
+        
+        update_one = repo.decks_collection.update_one
+        def racing_update(*args, **kwargs):
+            # Another request reads the deck just before the write lands
+            repo.find_by_id('1')
+            return update_one(*args, **kwargs)
+        
+        with patch.object(repo.decks_collection, 'update_one', side_effect=racing_update):
+            repo.save(DeckList(id='1', name='Renamed', cards=[]))
+        
+        assert repo.find_by_id('1').name == 'Renamed'
+
+    def test_caches_survive_concurrent_access(self, test_db):
+        """Test reads, writes and expiry from many threads keep the caches intact"""
+        from concurrent.futures import ThreadPoolExecutor
+        repo = MongoDeckRepository(test_db, cache_ttl=0.001, list_cache_ttl=0.001)
+        repo.save_many([DeckList(id=str(i), name=f'Deck {i}', cards=[]) for i in range(8)])
+        
+        def churn(i):
+            deck_id = str(i % 8)
+            for _ in range(25):
+                repo.find_by_id(deck_id)
+                repo.find_by_ids([deck_id, str((i + 1) % 8)])
+                repo.find_all()
+                repo.save(DeckList(id=deck_id, name=f'Deck {deck_id}', cards=[]))
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(16)))
+        
+        assert [d.id for d in repo.find_by_ids([str(i) for i in range(8)])] == [str(i) for i in range(8)]
+
+    def test_find_all_is_cached_until_write(self, test_db):
+        """Test deck listings are served from cache until a deck changes"""
+        repo = MongoDeckRepository(test_db)
+        repo.save(DeckList(id='1', name='Deck 1', cards=[]))
+        assert len(repo.find_all()) == 1
+
+        test_db['decks'].delete_many({})
+        assert len(repo.find_all()) == 1
+
+        repo.save(DeckList(id='2', name='Deck 2', cards=[]))
+        assert [d.id for d in repo.find_all()] == ['2']
+
+        repo.invalidate()
+        assert repo.find_by_id('1') is None
+
+    def test_find_all_summaries(self, test_db):
+        """Test listing decks as summaries without their card entries"""
+        repo = MongoDeckRepository(test_db)
+        repo.save(DeckList(id='1', name='Deck 1', cards=[
+            DeckCard(code='01001a', name='Spider-Man', quantity=1),
+            DeckCard(code='01002a', name='Iron Man', quantity=3),
+        ]))
+        repo.save(DeckList(id='2', name='Deck 2', cards=[]))
+
+        summaries = {s.id: s for s in repo.find_all(summary=True)}
+        assert set(summaries) == {'1', '2'}
+        assert summaries['1'].card_count() == 4
+
+        assert len(repo.find_all(summary=True, limit=1)) == 1
+
+    def test_iter_all_decks(self, test_db):
+        """Test streaming decks from the cursor"""
+        repo = MongoDeckRepository(test_db)
+        repo.save_many([
+            DeckList(id='1', name='Deck 1', cards=[]),
+            DeckList(id='2', name='Deck 2', cards=[]),
+        ])
+
+        decks = repo.iter_all(batch_size=1)
+        assert next(decks).id in {'1', '2'}
+        assert len(list(decks)) == 1
+
 
 class TestMongoGameRepository:
     """Test MongoGameRepository"""
@@ -270,4 +481,145 @@ class TestMongoGameRepository:
             repo.save(game)
         
         recent = repo.find_recent(limit=3)
-        assert len(recent) == 3
\ No newline at end of file
+        assert len(recent) == 3
+    
+    def test_find_all_game_summaries(self, test_db):
+        """Test listing games as summaries without players or play zones"""
+        from src.entities import GameSummary
+        repo = MongoGameRepository(test_db)
+        
+        game = repo.save(Game(name='Test Game', host='Alice', phase=GamePhase.LOBBY,
+                              players=(Player(name='Alice', is_host=True),), play_zone=None))
+        
+        summaries = repo.find_all(summary=True)
+        assert summaries == [GameSummary(id=game.id, name='Test Game', host='Alice',
+                                         phase=GamePhase.LOBBY, updated_at=summaries[0].updated_at)]
+        assert summaries[0].updated_at is not None
+    
+    def test_save_many_games(self, test_db):
+        """Test saving several games in one bulk write"""
+        repo = MongoGameRepository(test_db)
+        
+        games = [
+            Game(name=f'Game {i}', host=f'Player {i}', phase=GamePhase.LOBBY,
+                 players=(Player(name=f'Player {i}'),), play_zone=None)
+            for i in range(3)
+        ]
+        
+        saved = repo.save_many(games)
+        assert [g.id for g in saved] == [g.id for g in games]
+        assert test_db['games'].count_documents({}) == 3
+        assert repo.find_by_id(games[1].id).name == 'Game 1'
+        assert repo.save_many([]) == []
+
+class TestCoalescingRepository:
+    """Test CoalescingRepository"""
+    
+    def test_concurrent_identical_reads_share_one_query(self):
+        """Test concurrent reads with the same arguments run one query"""
+        import threading
+        import time
+        from unittest.mock import Mock
+        from src.repositories import CoalescingRepository
+        
+        release = threading.Event()
+        inner = Mock()
+        inner.find_by_code.side_effect = lambda code: release.wait() and code
+        repo = CoalescingRepository(inner, read_methods=('find_by_code',), write_methods=('save',))
+        
+        results = []
+        read = lambda: results.append(repo.find_by_code('01001a'))
+        leader = threading.Thread(target=read)
+        leader.start()
+        while inner.find_by_code.call_count == 0:
+            time.sleep(0.001)
+        # The leader is blocked inside the query, so these all join it
+        followers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        
+        assert results == ['01001a'] * 5
+        assert inner.find_by_code.call_count == 1
+        
+        repo.save('card')
+        inner.save.assert_called_once_with('card')
+        assert repo.find_by_code('01001b') == '01001b'
+        assert inner.find_by_code.call_count == 2
+    
+    def test_reads_after_a_write_skip_reads_started_during_it(self):
+        """Test a read that began mid-write isn't shared once the write returns"""
+        import threading
+        import time
+        from unittest.mock import Mock
+        from src.repositories import CoalescingRepository
+        
+        release = threading.Event()
+        def find_by_code(code):
+            # Only the first query blocks, standing in for a slow stale read
+            if inner.find_by_code.call_count == 1:
+                release.wait()
+            return code
+        inner = Mock()
+        inner.find_by_code.side_effect = find_by_code
+        repo = CoalescingRepository(inner, read_methods=('find_by_code',), write_methods=('save',))
+        
+        def save(card):
+            threading.Thread(target=repo.find_by_code, args=('01001a',)).start()
+            while inner.find_by_code.call_count == 0:
+                time.sleep(0.001)
+        inner.save.side_effect = save
+        repo.save('card')
+        
+        results = []
+        reader = threading.Thread(target=lambda: results.append(repo.find_by_code('01001a')))
+        reader.start()
+        reader.join(timeout=1)
+        release.set()
+        
+        assert results == ['01001a']
+        assert inner.find_by_code.call_count == 2
+    
+    def test_list_results_are_copied_per_caller(self):
+        """Test one caller changing its list doesn't change another's"""
+        from unittest.mock import Mock
+        from src.repositories import CoalescingRepository
+        
+        inner = Mock()
+        inner.find_all.return_value = ['01001a', '01002a']
+        repo = CoalescingRepository(inner, read_methods=('find_all',), write_methods=())
+        
+        first = repo.find_all()
+        first.append('01003a')
+        
+        assert repo.find_all() == ['01001a', '01002a']
+        assert inner.find_all.return_value == ['01001a', '01002a']
+    
+    def test_card_variant_is_a_card_repository(self):
+        """Test the card coalescer satisfies the CardRepository boundary"""
+        from unittest.mock import Mock
+        from src.boundaries import CardRepository
+        from src.repositories import CoalescingCardRepository
+        
+        inner = Mock()
+        inner.find_by_code.return_value = '01001a'
+        repo = CoalescingCardRepository(inner, read_methods=('find_by_code',), write_methods=())
+        
+        assert isinstance(repo, CardRepository)
+        assert repo.find_by_code('01001a') == '01001a'
+    
+    def test_read_errors_propagate(self):
+        """Test an exception from the shared query reaches the caller"""
+        from unittest.mock import Mock
+        from src.repositories import CoalescingRepository
+        
+        inner = Mock()
+        inner.find_by_code.side_effect = RuntimeError('connection lost')
+        repo = CoalescingRepository(inner, read_methods=('find_by_code',), write_methods=())
+        
+        with pytest.raises(RuntimeError):
+            repo.find_by_code('01001a')
+        assert repo._inflight == {}